@@ -10,7 +10,7 @@ import tempfile
 import uuid
 import xml.etree.ElementTree as et
 
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 # Precision of timestapms in timelines
 TIMELINE_PRECISION = 4
@@ -89,6 +89,11 @@ def to_compact_string(xml_node: et.Element) -> str:
     return et.tostring(xml_node).decode('utf-8').replace('\t', '').replace('\n', '').replace('\r', '')
 
 
+def vector_to_str(values: Iterable[str | float]) -> str:
+    # space separated vector value, the same text f'{x} {y} {z}' produces
+    return ' '.join(map(str, values))
+
+
 def get_len(iter: Any) -> int:
     if isinstance(iter, tuple) or isinstance(iter, list):
         return len(iter)
@@ -96,8 +101,15 @@ def get_len(iter: Any) -> int:
         return iter.__len__()
     raise RuntimeError("Cannot determine lenght of an object")
 
+def find_bg3_attribute(node: et.Element[str], attribute_name: str) -> et.Element[str] | None:
+    # walks the direct children, cheaper than a predicate path when called in a loop
+    for attribute_node in node:
+        if attribute_node.tag == 'attribute' and attribute_node.get('id') == attribute_name:
+            return attribute_node
+    return None
+
 def get_bg3_attribute(node: et.Element[str], attribute_name: str, /, value_name: str | None = None) -> str | None:
-    attribute_node = node.find(f'./attribute[@id="{attribute_name}"]')
+    attribute_node = find_bg3_attribute(node, attribute_name)
     if attribute_node is None:
         return None
     if len(attribute_node) == 1:
@@ -106,7 +118,7 @@ def get_bg3_attribute(node: et.Element[str], attribute_name: str, /, value_name:
     return attribute_node.get(effective_value_name)
 
 def get_required_bg3_attribute(node: et.Element[str], attribute_name: str, /, value_name: str | None = None) -> str:
-    attribute_node = node.find(f'./attribute[@id="{attribute_name}"]')
+    attribute_node = find_bg3_attribute(node, attribute_name)
     if attribute_node is None:
         raise ValueError(f"required BG3 attribute {attribute_name} doesn't exist")
     effective_value_name = "value" if value_name is None else value_name
@@ -117,6 +129,10 @@ def get_required_bg3_attribute(node: et.Element[str], attribute_name: str, /, va
         raise ValueError(f"required BG3 attribute {attribute_name} doesn't have a value")
     return value
 
+def get_bg3_attribute_value(node: et.Element[str], attribute_name: str) -> str | None:
+    attribute_node = find_bg3_attribute(node, attribute_name)
+    return None if attribute_node is None else attribute_node.get('value')
+
 def get_lsx_vector_attribute(attribute_node: et.Element[str]) -> tuple[str, ...]:
     if len(attribute_node) == 1:
         inner_node = attribute_node[0]
@@ -145,7 +161,7 @@ def get_lsx_vector_attribute(attribute_node: et.Element[str]) -> tuple[str, ...]
 
 
 def get_bg3_handle_attribute(node: et.Element[str], attribute_name: str, /, value_name: str | None = None) -> tuple[str, int]:
-    attribute_node = node.find(f'./attribute[@id="{attribute_name}"]')
+    attribute_node = find_bg3_attribute(node, attribute_name)
     if attribute_node is None:
         raise ValueError(f"required BG3 attribute {attribute_name} doesn't exist")
     effective_value_name = "handle" if value_name is None else value_name
@@ -167,7 +183,7 @@ def set_bg3_attribute(
         version: int | None = None,
         lsx: bool  = False
     ) -> None:
-    attribute_node = node.find(f'./attribute[@id="{attribute_name}"]')
+    attribute_node = find_bg3_attribute(node, attribute_name)
     if isinstance(attribute_value, float):
         value = str(dc.Decimal(str(attribute_value)).quantize(TIMELINE_DECIMAL_PRECISION))
     elif isinstance(attribute_value, int):
@@ -184,26 +200,23 @@ def set_bg3_attribute(
             if attribute_type == 'fvec2':
                 if len(values) != 2:
                     raise RuntimeError(f'expected two numbers, got {attribute_value}')
-                attribute_node = et.fromstring(
-                    f'<attribute id="{attribute_name}" type="fvec2">' +
-                    f'<float2 x="{values[0]}" y="{values[1]}" /></attribute>')
+                attribute_node = et.Element('attribute', id = attribute_name, type = 'fvec2')
+                et.SubElement(attribute_node, 'float2', x = values[0], y = values[1])
             elif attribute_type == 'fvec3':
                 if len(values) != 3:
                     raise RuntimeError(f'expected three numbers, got {attribute_value}')
-                attribute_node = et.fromstring(
-                    f'<attribute id="{attribute_name}" type="fvec3">' +
-                    f'<float3 x="{values[0]}" y="{values[1]} z="{values[2]}" /></attribute>')
+                attribute_node = et.Element('attribute', id = attribute_name, type = 'fvec3')
+                et.SubElement(attribute_node, 'float3', x = values[0], y = values[1], z = values[2])
             elif attribute_type == 'fvec4':
                 if len(values) != 4:
                     raise RuntimeError(f'expected four numbers, got {attribute_value}')
-                attribute_node = et.fromstring(
-                    f'<attribute id="{attribute_name}" type="fvec4">' +
-                    f'<float4 x="{values[0]}" y="{values[1]} z="{values[2]}" w="{values[3]}" /></attribute>')
+                attribute_node = et.Element('attribute', id = attribute_name, type = 'fvec4')
+                et.SubElement(attribute_node, 'float4', x = values[0], y = values[1], z = values[2], w = values[3])
         else:
             if version is not None:
-                attribute_node = et.fromstring(f'<attribute id="{attribute_name}" type="{attribute_type}" handle="{value}" version="{version}" />')
+                attribute_node = et.Element('attribute', id = attribute_name, type = attribute_type, handle = value, version = str(version))
             else:
-                attribute_node = et.fromstring(f'<attribute id="{attribute_name}" type="{attribute_type}" value="{value}" />')
+                attribute_node = et.Element('attribute', id = attribute_name, type = attribute_type, value = value)
         node.append(attribute_node)
     else:
         if attribute_type:
@@ -248,14 +261,14 @@ def set_bg3_attribute(
 
 
 def delete_bg3_attribute(node: et.Element[str], attribute_name: str) -> None:
-    attribute_node = node.find(f'./attribute[@id="{attribute_name}"]')
+    attribute_node = find_bg3_attribute(node, attribute_name)
     if attribute_node is None:
         raise ValueError(f"BG3 attribute {attribute_name} doesn't exist")
     node.remove(attribute_node)
 
 
 def has_bg3_attribute(node: et.Element[str], attribute_name: str) -> bool:
-    return node.find(f'./attribute[@id="{attribute_name}"]') is not None
+    return find_bg3_attribute(node, attribute_name) is not None
 
 
 def get_required_attribute(node: et.Element[str], attribute_name: str) -> str:
@@ -303,10 +316,9 @@ def lower_bound(nodes: list[et.Element[str]], attribute_getter: Callable[[et.Ele
 
 
 def find_object_by_map_key(target: et.Element[str], key: str) -> et.Element | None:
-    objs = target.findall('./children/node[@id="Object"]')
-    for obj in objs:
-        obj_key = get_required_bg3_attribute(obj, 'MapKey')
-        if key == obj_key:
+    # stops at the first match instead of collecting every map entry
+    for obj in target.iterfind('./children/node[@id="Object"]'):
+        if get_bg3_attribute_value(obj, 'MapKey') == key:
             return obj
     return None
 
@@ -315,13 +327,12 @@ def put_object_into_map(target: et.Element[str], obj: et.Element[str]) -> None:
     obj_key = get_required_bg3_attribute(obj, 'MapKey')
     children = target.find('./children')
     if children is None:
-        children = et.fromstring('<children></children>')
-        children.append(obj)
-        target.append(children)
+        et.SubElement(target, 'children').append(obj)
         return
-    existing_obj = find_object_by_map_key(target, obj_key)
-    if existing_obj is not None:
-        children.remove(existing_obj)
+    for existing_obj in children.iterfind('./node[@id="Object"]'):
+        if get_bg3_attribute_value(existing_obj, 'MapKey') == obj_key:
+            children.remove(existing_obj)
+            break
     children.append(obj)
 
 
@@ -338,15 +349,10 @@ def remove_object_by_map_key(target: et.Element[str], key: str) -> None:
 def get_or_create_child_node(parent_node: et.Element[str], chlild_node_id: str) -> et.Element[str]:
     children = parent_node.find('./children')
     if children is None:
-        result = et.fromstring(f'<node id="{chlild_node_id}"></node>')
-        children = et.fromstring(f'<children></children>')
-        children.append(result)
-        parent_node.append(children)
-        return result
+        return et.SubElement(et.SubElement(parent_node, 'children'), 'node', id = chlild_node_id)
     node = children.find(f'./node[@id="{chlild_node_id}"]')
     if node is None:
-        node = et.fromstring(f'<node id="{chlild_node_id}"></node>')
-        children.append(node)
+        node = et.SubElement(children, 'node', id = chlild_node_id)
     return node
 
 
@@ -496,7 +502,7 @@ def remove_all_nodes(node: et.Element[str]) -> None:
     if children is None:
         return
     node.remove(children)
-    node.append(et.fromstring('<children></children>'))
+    et.SubElement(node, 'children')
 
 def attrs_to_str(node: et.Element[str]) -> str:
     result = list[str]()
@@ -26,17 +26,30 @@ from ._types import XmlElement
 import copy
 import shutil
 import os
+import re
 import time
 import traceback
+import weakref
 import xml.etree.ElementTree as et
 
 from datetime import datetime, timezone
 from enum import StrEnum
-from typing import Callable
+from typing import Callable, Iterator
 
 
 PROGRESS_MSG_LEN = 72
 
+# anything except these is dropped from mod short names
+INVALID_MOD_NAME_CHARS = re.compile(r'[^A-Za-z0-9._-]')
+
+# region id -> (node id, report name, selector of mergeable nodes, deduplication attribute)
+MERGEABLE_REGIONS: dict[str, tuple[str, str, str, str]] = {
+    'Gossips': ('root', 'gossips', './node[@id="Gossip"]', 'DialogUUID'),
+    'Templates': ('Templates', 'game objects', './node[@id="GameObjects"]', 'MapKey'),
+    'TranslatedStringKeys': ('TranslatedStringKeys', 'translated string keys', './node[@id="TranslatedStringKey"]', 'UUID'),
+    'CharacterVisualBank': ('CharacterVisualBank', 'character visuals', './node[@id="Resource"]', 'ID'),
+}
+
 
 class conflict_resolution_method(StrEnum):
     MERGE = "merge"
@@ -113,11 +126,13 @@ class mod_manager:
     __mods_index: dict[str, mod_info]
     __conflicts: list[mod_conflict]
     __conflicts_imm: tuple[mod_conflict, ...]
-    __conflicting_files: dict[str, list[str]]
+    __conflicting_files: dict[str, set[str]]
     __loca: loca_object | None
-    __report: list[str]
+    __report: list[tuple[int, str]]
+    __verbose_report: bool
+    __merge_index_cache: weakref.WeakKeyDictionary[XmlElement, dict[tuple[str, str], set[str]]]
 
-    def __init__(self, f: game_files, bg3_appdata_path: str | None = None) -> None:
+    def __init__(self, f: game_files, bg3_appdata_path: str | None = None, verbose_report: bool = True) -> None:
         if bg3_appdata_path is None:
             bg3_appdata_path = find_bg3_appdata_path()
         if bg3_appdata_path is None:
@@ -131,15 +146,20 @@ class mod_manager:
         self.__mods_index = dict[str, mod_info]()
         self.__conflicts = list[mod_conflict]()
         self.__conflicts_imm = ()
-        self.__conflicting_files = dict[str, list[str]]()
+        self.__conflicting_files = dict[str, set[str]]()
         self.__loca = None
-        self.__report = list[str]()
+        self.__report = list[tuple[int, str]]()
+        self.__verbose_report = verbose_report
+        self.__merge_index_cache = weakref.WeakKeyDictionary[XmlElement, dict[tuple[str, str], set[str]]]()
 
     def add_to_report(self, message: str) -> None:
-        log_msg = f'{datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")}: {message}'
-        self.__report.append(log_msg)
+        self.__report.append((time.time_ns(), message))
         get_logger().info(message)
 
+    @staticmethod
+    def __format_report_line(timestamp_ns: int, message: str) -> str:
+        return f'{datetime.fromtimestamp(timestamp_ns / 1e9, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")}: {message}'
+
     def get_mod_info(self, mod_uuid: str) -> mod_info:
         if mod_uuid in self.__mods_index:
             return self.__mods_index[mod_uuid]
@@ -240,16 +260,15 @@ class mod_manager:
         self.__conflicts_imm = ()
         self.__load_modsettings()
 
-        all_files = os.listdir(self.__mods_dir_path)
-        total_count = len([f for f in all_files if f.endswith('.pak')])
+        with os.scandir(self.__mods_dir_path) as it:
+            pak_entries = [e for e in it if e.name.endswith('.pak') and e.is_file()]
+        total_count = len(pak_entries)
         count = 0
-        for f in all_files:
-            pak_path = os.path.join(self.__mods_dir_path, f)
-            if os.path.isfile(pak_path) and pak_path.endswith('.pak'):
-                count += 1
-                if progress_callback is not None:
-                    progress_callback(count, total_count, f'[{count:3}/{total_count:3}] Reading pak file: {os.path.basename(pak_path)}')
-                self.__add_mod(pak_path)
+        for e in pak_entries:
+            count += 1
+            if progress_callback is not None:
+                progress_callback(count, total_count, f'[{count:3}/{total_count:3}] Reading pak file: {e.name}')
+            self.__add_mod(e.path)
         self.__filter_out_mods()
         self.__mods_imm = tuple(self.__mods)
 
@@ -335,7 +354,7 @@ class mod_manager:
 
     @property
     def report(self) -> tuple[str, ...]:
-        return tuple(self.__report)
+        return tuple(mod_manager.__format_report_line(ts, msg) for ts, msg in self.__report)
 
     @staticmethod
     def __get_mod_version(node: XmlElement) -> tuple[int, int, int, int]:
@@ -551,12 +570,32 @@ class mod_manager:
             now = datetime.now()
             suffix = 'success' if success else 'failure'
             file_path = os.path.join(self.__env.env_root_path, f'worklog-{suffix}-{now.year:04}{now.month:02}{now.day:02}-{now.hour:02}{now.minute:02}{now.second:02}.txt')
-            with open(file_path, 'w') as f:
-                for line in self.__report:
-                    f.write(line)
+            with open(file_path, 'w', encoding = 'utf-8', buffering = 1 << 20) as f:
+                if self.__report:
+                    f.write('\n'.join(self.report))
                     f.write('\n')
 
 
+    @staticmethod
+    def __get_bank_resources(root_node: XmlElement, bank_id: str) -> list[XmlElement]:
+        # Equivalent of ./region[@id=bank_id]/node[@id=bank_id]/children/node[@id="Resource"],
+        # walks the children directly instead of going through the XPath parser
+        result = list[XmlElement]()
+        for region in root_node:
+            if region.tag != 'region' or region.get('id') != bank_id:
+                continue
+            for bank in region:
+                if bank.tag != 'node' or bank.get('id') != bank_id:
+                    continue
+                for children in bank:
+                    if children.tag != 'children':
+                        continue
+                    for resource in children:
+                        if resource.tag == 'node' and resource.get('id') == 'Resource':
+                            result.append(resource)
+        return result
+
+
     def merge_resource_banks(
             self,
             mod_priority_order: tuple[mod_info, ...],
@@ -581,11 +620,13 @@ class mod_manager:
 
                 f_dirs = f.split('/')
                 # Dialog and Timeline banks
-                if len(f_dirs) > 2 and f_dirs[0] == 'Public' and f_dirs[2] == 'Content' and f.endswith('.lsf'):
+                # pak_content has already opened every Content .lsf, only files that turned out to be banks are read again
+                if len(f_dirs) > 2 and f_dirs[0] == 'Public' and f_dirs[2] == 'Content' and f.endswith('.lsf') \
+                        and (mi.content is None or mi.content.is_resource_bank_file(f)):
                     gf = game_file(self.__assets.tool, f, pak_name = mi.pak_path)
                     root_node = gf.xml.getroot()
                     # Dialog bank
-                    dialog_resources = root_node.findall('./region[@id="DialogBank"]/node[@id="DialogBank"]/children/node[@id="Resource"]')
+                    dialog_resources = mod_manager.__get_bank_resources(root_node, 'DialogBank')
                     if len(dialog_resources) > 0:
                         self.add_to_report(f'found dialog bank {f} with {len(dialog_resources)} resources')
                         self.append_to_exclusion_list(mi.mod_uuid, f)
@@ -600,7 +641,7 @@ class mod_manager:
                             else:
                                 self.add_to_report(f'not added to the dialog bank because this file is in exclusion list: {source_file}')
                     # Timeline bank
-                    timeline_resources = root_node.findall('./region[@id="TimelineBank"]/node[@id="TimelineBank"]/children/node[@id="Resource"]')
+                    timeline_resources = mod_manager.__get_bank_resources(root_node, 'TimelineBank')
                     if len(timeline_resources) > 0:
                         self.add_to_report(f'found timeline bank {f} with {len(timeline_resources)} resources')
                         self.append_to_exclusion_list(mi.mod_uuid, f)
@@ -648,54 +689,48 @@ class mod_manager:
 
 
     def __merge_xml(self, dest_node: XmlElement, src_node: XmlElement, selector: str, dedup_attribute: str) -> None:
-        existing_nodes_ids = set()
-        existing_nodes = dest_node.findall(selector)
-        for n in existing_nodes:
-            existing_nodes_ids.add(get_required_bg3_attribute(n, dedup_attribute))
-        nodes = src_node.findall(selector)
-        for node in nodes:
-            if get_required_bg3_attribute(node, dedup_attribute) in existing_nodes_ids:
+        # the dedup keys of dest_node are collected once and kept up to date across merges
+        indexes = self.__merge_index_cache.setdefault(dest_node, dict[tuple[str, str], set[str]]())
+        existing_nodes_ids = indexes.get((selector, dedup_attribute))
+        if existing_nodes_ids is None:
+            existing_nodes_ids = { get_required_bg3_attribute(n, dedup_attribute) for n in dest_node.iterfind(selector) }
+            indexes[(selector, dedup_attribute)] = existing_nodes_ids
+        for node in src_node.iterfind(selector):
+            node_id = get_required_bg3_attribute(node, dedup_attribute)
+            if node_id in existing_nodes_ids:
                 continue
             dest_node.append(node)
+            existing_nodes_ids.add(node_id)
 
 
-    def __merge_overlapping_files(self, base_file: game_file, overlapping_file: game_file) -> None:
-        # Gossips
-        self.add_to_report(f'merging files: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
-        base_node_root = base_file.xml.find('./region[@id="Gossips"]/node[@id="root"]/children')
-        if base_node_root is not None:
-            overlap_node_root = overlapping_file.xml.find('./region[@id="Gossips"]/node[@id="root"]/children')
-            if overlap_node_root is not None:
-                self.add_to_report(f'merging gossips: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
-                self.__merge_xml(base_node_root, overlap_node_root, './node[@id="Gossip"]', 'DialogUUID')
-                return
-
-        # Game Objects and Root Templates
-        base_node_root = base_file.xml.find('./region[@id="Templates"]/node[@id="Templates"]/children')
-        if base_node_root is not None:
-            overlap_node_root = overlapping_file.xml.find('./region[@id="Templates"]/node[@id="Templates"]/children')
-            if overlap_node_root is not None:
-                self.add_to_report(f'merging game objects: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
-                self.__merge_xml(base_node_root, overlap_node_root, './node[@id="GameObjects"]', 'MapKey')
-                return
+    # returns the children nodes of the mergeable regions in the base file, by region id
+    def __get_mergeable_node_roots(self, base_file: game_file) -> dict[str, XmlElement]:
+        base_node_roots = dict[str, XmlElement]()
+        for region in base_file.xml.getroot():
+            if region.tag != 'region':
+                continue
+            region_id = region.get('id')
+            if region_id not in MERGEABLE_REGIONS or region_id in base_node_roots:
+                continue
+            base_node_root = region.find(f'./node[@id="{MERGEABLE_REGIONS[region_id][0]}"]/children')
+            if base_node_root is not None:
+                base_node_roots[region_id] = base_node_root
+        return base_node_roots
 
-        # Translated String Keys
-        base_node_root = base_file.xml.find('./region[@id="TranslatedStringKeys"]/node[@id="TranslatedStringKeys"]/children')
-        if base_node_root is not None:
-            overlap_node_root = overlapping_file.xml.find('./region[@id="TranslatedStringKeys"]/node[@id="TranslatedStringKeys"]/children')
-            if overlap_node_root is not None:
-                self.add_to_report(f'merging translated string keys: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
-                self.__merge_xml(base_node_root, overlap_node_root, './node[@id="TranslatedStringKey"]', 'UUID')
-                return
 
-        # Character Visuals
-        base_node_root = base_file.xml.find('./region[@id="CharacterVisualBank"]/node[@id="CharacterVisualBank"]/children')
-        if base_node_root is not None:
-            overlap_node_root = overlapping_file.xml.find('./region[@id="CharacterVisualBank"]/node[@id="CharacterVisualBank"]/children')
-            if overlap_node_root is not None:
-                self.add_to_report(f'merging character visuals: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
-                self.__merge_xml(base_node_root, overlap_node_root, './node[@id="Resource"]', 'ID')
-                return
+    def __merge_overlapping_file(self, base_file: game_file, base_node_roots: dict[str, XmlElement], overlapping_file: game_file) -> None:
+        self.add_to_report(f'merging files: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
+        overlap_regions = { region.get('id') : region for region in overlapping_file.xml.getroot() if region.tag == 'region' }
+        for region_id, (node_id, what, selector, dedup_attribute) in MERGEABLE_REGIONS.items():
+            base_node_root = base_node_roots.get(region_id)
+            if base_node_root is None or region_id not in overlap_regions:
+                continue
+            overlap_node_root = overlap_regions[region_id].find(f'./node[@id="{node_id}"]/children')
+            if overlap_node_root is None:
+                continue
+            self.add_to_report(f'merging {what}: {base_file.relative_file_path} <- {overlapping_file.relative_file_path}')
+            self.__merge_xml(base_node_root, overlap_node_root, selector, dedup_attribute)
+            return
 
 
     def __is_mergeable(self, file_name: str) -> bool:
@@ -711,6 +746,15 @@ class mod_manager:
         return False
 
 
+    @staticmethod
+    def __get_overlap_key(f: str) -> str:
+        ps = f.split('/')
+        if len(ps) > 2 and (ps[0] == 'Mods' or ps[0] == 'Public'):
+            ps[1] = '$ModName$'
+        if len(ps) > 3 and ps[0] == 'Generated' and ps[1] == 'Public':
+            ps[2] = '$ModName$'
+        return '/'.join(ps)
+
     def merge_overlapping_files(
             self,
             mod_priority_order: tuple[mod_info, ...],
@@ -719,6 +763,7 @@ class mod_manager:
         if progress_callback is not None:
             progress_callback(0, 0, 'Merging overlapping files...')
 
+        # overlap key -> (base mod index, [(mod index, overlap key), ...])
         overlapping_files_dict = dict[str, tuple[int, list[tuple[int, str]]]]()
         mod_index = 0
         for mod in mod_priority_order:
@@ -727,29 +772,22 @@ class mod_manager:
             for f in mod.content.files:
                 if not self.__is_mergeable(f):
                     continue
-                ps = f.split('/')
-                if len(ps) > 2 and (ps[0] == 'Mods' or ps[0] == 'Public'):
-                    ps[1] = '$ModName$'
-                if len(ps) > 3 and ps[0] == 'Generated' and ps[1] == 'Public':
-                    ps[2] = '$ModName$'
-                f = '/'.join(ps)
-                if f in overlapping_files_dict:
-                    overlapping_files_dict[f][1].append((mod_index, f))
-                else:
+                f = mod_manager.__get_overlap_key(f)
+                entry = overlapping_files_dict.get(f)
+                if entry is None:
                     overlapping_files_dict[f] = (mod_index, [])
+                else:
+                    entry[1].append((mod_index, f))
             mod_index += 1
 
-        total_count = len(overlapping_files_dict)
+        # only keys present in more than one mod need merging
+        overlapping_sets = [(k, v) for k, v in overlapping_files_dict.items() if v[1]]
+        total_count = len(overlapping_sets)
         count = 0
         t = time.time()
-        for base_file_name, v in overlapping_files_dict.items():
+        for key, (base_mod_index, overlapping) in overlapping_sets:
             count += 1
-
-            base_mod_index, overlapping = v
-            if len(overlapping) == 0:
-                continue
-
-            base_file_name = base_file_name.replace('$ModName$', mod_priority_order[base_mod_index].mod_folder)
+            base_file_name = key.replace('$ModName$', mod_priority_order[base_mod_index].mod_folder)
 
             if progress_callback is not None and time.time() - t >= 1.0:
                 t = time.time()
@@ -759,14 +797,35 @@ class mod_manager:
                     s = f'Merging overlapping files: ...{base_file_name[n + 2:]}'
                 progress_callback(count, total_count, s)
 
-            bf = game_file(self.__assets.tool, base_file_name, pak_name = mod_priority_order[base_mod_index].pak_path, mod_specific = True)
-            for mod_idx, file_name in overlapping:
-                file_name = file_name.replace('$ModName$', mod_priority_order[mod_idx].mod_folder)
-                of = game_file(self.__assets.tool, file_name, pak_name = mod_priority_order[mod_idx].pak_path, mod_specific = True)
-                self.__merge_overlapping_files(bf, of)
-                self.append_to_exclusion_list(mod_priority_order[mod_idx].mod_uuid, file_name)
+            bf, merged_files = self.__merge_overlapping_file_set(mod_priority_order, base_mod_index, base_file_name, overlapping)
             self.__assets.files.add(bf)
-            self.append_to_exclusion_list(mod_priority_order[base_mod_index].mod_uuid, base_file_name)
+            for mod_uuid, file_name in merged_files:
+                self.append_to_exclusion_list(mod_uuid, file_name)
+
+    # merges every copy of one file into the copy from the top priority mod
+    # returns the merged file and the (mod uuid, file name) pairs to exclude from copying
+    def __merge_overlapping_file_set(
+            self,
+            mod_priority_order: tuple[mod_info, ...],
+            base_mod_index: int,
+            base_file_name: str,
+            overlapping: list[tuple[int, str]]
+    ) -> tuple[game_file, list[tuple[str, str]]]:
+        merged_files = list[tuple[str, str]]()
+        bf = game_file(self.__assets.tool, base_file_name, pak_name = mod_priority_order[base_mod_index].pak_path, mod_specific = True)
+        # the base tree is indexed once and all overlapping files are folded into it in priority order
+        base_node_roots = self.__get_mergeable_node_roots(bf)
+        for mod_idx, file_name in overlapping:
+            file_name = file_name.replace('$ModName$', mod_priority_order[mod_idx].mod_folder)
+            merged_files.append((mod_priority_order[mod_idx].mod_uuid, file_name))
+            if not base_node_roots:
+                # nothing in the base can take entries from this file, so it is not unpacked and parsed
+                self.add_to_report(f'skipped merging files: {base_file_name} <- {file_name}, no mergeable regions in the base')
+                continue
+            of = game_file(self.__assets.tool, file_name, pak_name = mod_priority_order[mod_idx].pak_path, mod_specific = True)
+            self.__merge_overlapping_file(bf, base_node_roots, of)
+        merged_files.append((mod_priority_order[base_mod_index].mod_uuid, base_file_name))
+        return bf, merged_files
 
 
     def append_text_content(self, gf: game_file) -> None:
@@ -783,21 +842,26 @@ class mod_manager:
 
     @staticmethod
     def make_mod_short_name(name: str) -> str:
-        valid_chars = 'QWERTYUIOPASDFGHJKLZXCVBNMqwertyuiopasdfghjklzxcvbnm0123456789.-_'
-        result = ''
-        for c in name:
-            if c in valid_chars:
-                result += c
-        if len(result) > 48:
-            return result[:48]
-        return result
+        return INVALID_MOD_NAME_CHARS.sub('', name)[:48]
 
 
     def merge_text_files(self, dest_path: str, src_path: str) -> None:
-        with open(dest_path, 'a') as dest:
-            with open(src_path, 'r') as src:
-                dest.write('\n')
-                dest.writelines(src.readlines())
+        # streamed as bytes, the text is not decoded or split into lines
+        with open(dest_path, 'ab') as dest:
+            with open(src_path, 'rb') as src:
+                dest.write(os.linesep.encode())
+                shutil.copyfileobj(src, dest, 1 << 20)
+
+
+    @staticmethod
+    # yields files together with the names of the directories between dir_path and the file
+    def __iter_files(dir_path: str, rel_dirs: tuple[str, ...] = ()) -> Iterator[tuple[os.DirEntry[str], tuple[str, ...]]]:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks = False):
+                    yield from mod_manager.__iter_files(entry.path, rel_dirs + (entry.name,))
+                elif entry.is_file(follow_symlinks = False):
+                    yield entry, rel_dirs
 
 
     # this procedure should copy files from source mods to the destination mod
@@ -814,52 +878,53 @@ class mod_manager:
             mod_uuid: str,
             progress_callback: Callable[[int, int, str], None] | None = None
     ) -> None:
-        total_count = 0
-        for _, _, files in os.walk(src_mod_root_path):
-            total_count += len(files)
+        files = list(mod_manager.__iter_files(src_mod_root_path))
+        stats_dir = f'{os.sep}Stats{os.sep}'
+        goals_dir = f'{os.sep}Story{os.sep}RawFiles{os.sep}Goals{os.sep}'
+        total_count = len(files)
         count = 0
         
         t = time.time()
         self.add_to_report(f'copying files from mod {mod_uuid}, source root path {src_mod_root_path}, destination root path {dest_dir_path}')
-        for dir, _, files in os.walk(src_mod_root_path):
-            for file in files:
-                full_src_path = os.path.join(dir, file)
+        for entry, entry_rel_dirs in files:
+            file = entry.name
+            full_src_path = entry.path
 
-                count += 1
-                if progress_callback is not None and time.time() - t >= 1.0:
-                    t = time.time()
-                    s = f'Copying files: {full_src_path}'
-                    if len(s) > PROGRESS_MSG_LEN:
-                        n = len(s) - PROGRESS_MSG_LEN
-                        s = f'Copying files: ...{full_src_path[n + 2:]}'
-                    progress_callback(count, total_count, s)
+            count += 1
+            if progress_callback is not None and time.time() - t >= 1.0:
+                t = time.time()
+                s = f'Copying files: {full_src_path}'
+                if len(s) > PROGRESS_MSG_LEN:
+                    n = len(s) - PROGRESS_MSG_LEN
+                    s = f'Copying files: ...{full_src_path[n + 2:]}'
+                progress_callback(count, total_count, s)
 
-                rel_dirs = os.path.dirname(os.path.relpath(full_src_path, src_mod_root_path)).split('\\')
-                if len(rel_dirs) >= 2:
-                    if rel_dirs[0] == 'Mods' or rel_dirs[0] == 'Public':
-                        rel_dirs[1] = mod_folder
-                if len(rel_dirs) >= 3:
-                    if rel_dirs[0] == 'Generated' and rel_dirs[1] == 'Public':
-                        rel_dirs[2] = mod_folder
-                dest_path = os.path.join(os.path.join(dest_dir_path, *rel_dirs), file)
-                if not self.is_in_exclusion_list(mod_uuid, full_src_path):
-                    if os.path.isfile(dest_path):
-                        if '\\Stats\\' in dest_path:
-                            self.merge_text_files(dest_path, full_src_path)
-                            self.add_to_report(f'a file already exists at destination {dest_path}, merged text from {full_src_path}')
-                        elif '\\Story\\RawFiles\\Goals\\' in dest_path and dest_path.endswith('.txt'):
-                            new_dest_path = dest_path.replace('.txt', new_random_uuid()[:8] + '.txt')
-                            self.add_to_report(f'copying {full_src_path} to {new_dest_path}')
-                            os.makedirs(os.path.dirname(new_dest_path), exist_ok = True)
-                            shutil.copy(full_src_path, new_dest_path)
-                        else:
-                            self.add_to_report(f'a file already exists at destination {dest_path}, skipped copying {full_src_path}')
+            rel_dirs = list(entry_rel_dirs)
+            if len(rel_dirs) >= 2:
+                if rel_dirs[0] == 'Mods' or rel_dirs[0] == 'Public':
+                    rel_dirs[1] = mod_folder
+            if len(rel_dirs) >= 3:
+                if rel_dirs[0] == 'Generated' and rel_dirs[1] == 'Public':
+                    rel_dirs[2] = mod_folder
+            dest_path = os.path.join(os.path.join(dest_dir_path, *rel_dirs), file)
+            if not self.is_in_exclusion_list(mod_uuid, full_src_path):
+                if os.path.isfile(dest_path):
+                    if stats_dir in dest_path:
+                        self.merge_text_files(dest_path, full_src_path)
+                        self.add_to_report(f'a file already exists at destination {dest_path}, merged text from {full_src_path}')
+                    elif goals_dir in dest_path and dest_path.endswith('.txt'):
+                        new_dest_path = dest_path.replace('.txt', new_random_uuid()[:8] + '.txt')
+                        self.add_to_report(f'copying {full_src_path} to {new_dest_path}')
+                        os.makedirs(os.path.dirname(new_dest_path), exist_ok = True)
+                        shutil.copyfile(full_src_path, new_dest_path)
                     else:
-                        self.add_to_report(f'copying {full_src_path} to {dest_path}')
-                        os.makedirs(os.path.dirname(dest_path), exist_ok = True)
-                        shutil.copy(full_src_path, dest_path)
+                        self.add_to_report(f'a file already exists at destination {dest_path}, skipped copying {full_src_path}')
                 else:
-                    self.add_to_report(f'skipped {full_src_path} because it is in exclusion list of [{mod_uuid}]')
+                    self.add_to_report(f'copying {full_src_path} to {dest_path}')
+                    os.makedirs(os.path.dirname(dest_path), exist_ok = True)
+                    shutil.copyfile(full_src_path, dest_path)
+            else:
+                self.add_to_report(f'skipped {full_src_path} because it is in exclusion list of [{mod_uuid}]')
         self.add_to_report(f'finished copying files from mod {mod_uuid}')
 
 
@@ -908,66 +973,60 @@ class mod_manager:
             if modcontent is None:
                 continue
             mod_uuid = modinfo.mod_uuid
-            if modcontent.has_content_bundle(dialog_uuid):
-                cb = modcontent.get_content_bundle(dialog_uuid)
-
-                if result_dialog is None:
-                    # the top priority dialog object
-                    if cb.dialog_file:
-                        self.add_to_report(f'baseline dialog {dialog_name} is taken from mod {modinfo.mod_short_name} [{mod_uuid}]')
-                        self.append_to_exclusion_list(mod_uuid, cb.dialog_file)
-                        result_dialog = dialog_object(game_file(self.__assets.tool, cb.dialog_file, pak_name = modinfo.pak_path, mod_specific = True))
-                        result_dialog_resource = self.get_dialog_resource(dialog_uuid, modcontent)
-                        dialog_nodes_diff = d_differ.get_modified_dialog_nodes(result_dialog, dialog_uuid)
-                        root_nodes_diff = d_differ.get_modified_dialog_root_nodes(result_dialog, dialog_uuid)
-                else:
-                    # the next conflicting dialog object
-                    if cb.dialog_file:
-                        self.add_to_report(f'merging dialog {dialog_name} from mod {modinfo.mod_short_name} [{mod_uuid}]')
-                        self.append_to_exclusion_list(mod_uuid, cb.dialog_file)
-                        modded_dialog = dialog_object(game_file(self.__assets.tool, cb.dialog_file, pak_name = modinfo.pak_path))
-                        diff = d_differ.get_modified_dialog_nodes(modded_dialog, dialog_uuid)
-                        root_diff = d_differ.get_modified_dialog_root_nodes(modded_dialog, dialog_uuid)
-                        self.merge_dialog_nodes(dialog_uuid, result_dialog, dialog_nodes_diff, root_nodes_diff, modded_dialog, diff, root_diff)
+            cb = modcontent.try_get_content_bundle(dialog_uuid)
+            if cb is None:
+                continue
 
+            if result_dialog is None:
+                # the top priority dialog object
+                if cb.dialog_file:
+                    self.add_to_report(f'baseline dialog {dialog_name} is taken from mod {modinfo.mod_short_name} [{mod_uuid}]')
+                    self.append_to_exclusion_list(mod_uuid, cb.dialog_file)
+                    result_dialog = dialog_object(game_file(self.__assets.tool, cb.dialog_file, pak_name = modinfo.pak_path, mod_specific = True))
+                    result_dialog_resource = self.get_dialog_resource(dialog_uuid, modcontent)
+                    dialog_nodes_diff = d_differ.get_modified_dialog_nodes(result_dialog, dialog_uuid)
+                    root_nodes_diff = d_differ.get_modified_dialog_root_nodes(result_dialog, dialog_uuid)
+            else:
+                # the next conflicting dialog object
+                if cb.dialog_file:
+                    self.add_to_report(f'merging dialog {dialog_name} from mod {modinfo.mod_short_name} [{mod_uuid}]')
+                    self.append_to_exclusion_list(mod_uuid, cb.dialog_file)
+                    modded_dialog = dialog_object(game_file(self.__assets.tool, cb.dialog_file, pak_name = modinfo.pak_path))
+                    diff = d_differ.get_modified_dialog_nodes(modded_dialog, dialog_uuid)
+                    root_diff = d_differ.get_modified_dialog_root_nodes(modded_dialog, dialog_uuid)
+                    self.merge_dialog_nodes(dialog_uuid, result_dialog, dialog_nodes_diff, root_nodes_diff, modded_dialog, diff, root_diff)
+
+            if cb.timeline_file:
+                # the dialog object is resolved once and shared by both timeline branches
+                d = result_dialog if result_dialog else self.__assets.get_dialog_object(dialog_uuid)
                 if result_timeline is None:
                     # the top priority timeline object
-                    if cb.timeline_file:
-                        self.add_to_report(f'baseline timeline {timeline_name} is taken from mod {modinfo.mod_short_name} [{mod_uuid}]')
-                        self.append_to_exclusion_list(mod_uuid, cb.timeline_file)
-                        gf = game_file(self.__assets.tool, cb.timeline_file, pak_name = modinfo.pak_path)
-                        if result_dialog:
-                            d = result_dialog
-                        else:
-                            d = self.__assets.get_dialog_object(dialog_uuid)
-                        result_timeline = timeline_object(gf, d)
-                        result_timeline_resource = self.get_timeline_resource(cb.timeline_uuid, modcontent)
-                        timeline_nodes_diff = t_differ.get_modified_timeline_nodes(result_timeline, dialog_uuid)
-                        for diff_state in timeline_nodes_diff.values():
-                            phase_uuid = diff_state.split('|')[1]
-                            changed_phases.add(phase_uuid)
+                    self.add_to_report(f'baseline timeline {timeline_name} is taken from mod {modinfo.mod_short_name} [{mod_uuid}]')
+                    self.append_to_exclusion_list(mod_uuid, cb.timeline_file)
+                    gf = game_file(self.__assets.tool, cb.timeline_file, pak_name = modinfo.pak_path)
+                    result_timeline = timeline_object(gf, d)
+                    result_timeline_resource = self.get_timeline_resource(cb.timeline_uuid, modcontent)
+                    timeline_nodes_diff = t_differ.get_modified_timeline_nodes(result_timeline, dialog_uuid)
+                    for diff_state in timeline_nodes_diff.values():
+                        phase_uuid = diff_state.split('|')[1]
+                        changed_phases.add(phase_uuid)
                 else:
                     # the next conflicting timeline object
-                    if cb.timeline_file:
-                        self.add_to_report(f'merging timeline {timeline_name} from mod {modinfo.mod_short_name} [{mod_uuid}]')
-                        self.append_to_exclusion_list(mod_uuid, cb.timeline_file)
-                        gf = game_file(self.__assets.tool, cb.timeline_file, pak_name=modinfo.pak_path)
-                        if result_dialog:
-                            d = result_dialog
-                        else:
-                            d = self.__assets.get_dialog_object(dialog_uuid)
-                        modded_timeline = timeline_object(gf, d)
-                        timeline_nodes_diff = t_differ.get_modified_timeline_nodes(modded_timeline, dialog_uuid)
-                        self.merge_timeline_nodes(dialog_uuid, result_timeline, changed_phases, modded_timeline, timeline_nodes_diff)
-
-                # Take the scene file from the top priority mod
-                # Resolution of scene conflicts is not supported yet
-                if result_scene_file_lsf is None and cb.scene_lsf_file:
-                    result_scene_file_lsf = game_file(self.__assets.tool, cb.scene_lsf_file, pak_name = modinfo.pak_path, mod_specific = True)
-                    self.append_to_exclusion_list(mod_uuid, cb.scene_lsf_file)
-                if result_scene_file_lsx is None and cb.scene_lsx_file:
-                    result_scene_file_lsx = game_file(self.__assets.tool, cb.scene_lsx_file, pak_name = modinfo.pak_path, mod_specific = True)
-                    self.append_to_exclusion_list(mod_uuid, cb.scene_lsx_file)
+                    self.add_to_report(f'merging timeline {timeline_name} from mod {modinfo.mod_short_name} [{mod_uuid}]')
+                    self.append_to_exclusion_list(mod_uuid, cb.timeline_file)
+                    gf = game_file(self.__assets.tool, cb.timeline_file, pak_name=modinfo.pak_path)
+                    modded_timeline = timeline_object(gf, d)
+                    timeline_nodes_diff = t_differ.get_modified_timeline_nodes(modded_timeline, dialog_uuid)
+                    self.merge_timeline_nodes(dialog_uuid, result_timeline, changed_phases, modded_timeline, timeline_nodes_diff)
+
+            # Take the scene file from the top priority mod
+            # Resolution of scene conflicts is not supported yet
+            if result_scene_file_lsf is None and cb.scene_lsf_file:
+                result_scene_file_lsf = game_file(self.__assets.tool, cb.scene_lsf_file, pak_name = modinfo.pak_path, mod_specific = True)
+                self.append_to_exclusion_list(mod_uuid, cb.scene_lsf_file)
+            if result_scene_file_lsx is None and cb.scene_lsx_file:
+                result_scene_file_lsx = game_file(self.__assets.tool, cb.scene_lsx_file, pak_name = modinfo.pak_path, mod_specific = True)
+                self.append_to_exclusion_list(mod_uuid, cb.scene_lsx_file)
 
 
         if result_dialog is None and result_timeline is None:
@@ -1064,11 +1123,11 @@ class mod_manager:
 
     def append_to_exclusion_list(self, mod_uuid: str, file: str) -> None:
         if mod_uuid not in self.__conflicting_files:
-            conflicting_files = list[str]()
+            conflicting_files = set[str]()
             self.__conflicting_files[mod_uuid] = conflicting_files
         else:
             conflicting_files = self.__conflicting_files[mod_uuid]
-        conflicting_files.append(file.replace('/', '\\'))
+        conflicting_files.add(file.replace('/', '\\'))
         self.add_to_report(f'added to exclusion list of mod [{mod_uuid}]: {file}')
 
 
@@ -1076,9 +1135,16 @@ class mod_manager:
         if mod_uuid not in self.__conflicting_files:
             return False
         conflicting_files = self.__conflicting_files[mod_uuid]
-        for conflicting_file in conflicting_files:
-            if file.endswith(conflicting_file):
+        # exclusion list entries are path suffixes, either '\\name' or 'dir\\name',
+        # so only the suffixes that start at a path separator have to be looked up
+        file = file.replace('/', '\\')
+        if file in conflicting_files:
+            return True
+        pos = file.find('\\')
+        while pos != -1:
+            if file[pos:] in conflicting_files or file[pos + 1:] in conflicting_files:
                 return True
+            pos = file.find('\\', pos + 1)
         return False
 
 
@@ -1095,7 +1161,8 @@ class mod_manager:
         try:
             self.add_to_report(f'merging dialog nodes for {dialog_uuid}')
             for node_uuid, node_state in source_diff.items():
-                self.add_to_report(f'dialog node {node_uuid}, diff {node_state}')
+                if self.__verbose_report:
+                    self.add_to_report(f'dialog node {node_uuid}, diff {node_state}')
                 if node_uuid in destination_diff:
                     self.add_to_report(f'dialog node {node_uuid} is already changed in higher priority mod, skipped')
                     continue
@@ -1112,18 +1179,21 @@ class mod_manager:
                     self.add_to_report(f'copied dialog node {node_uuid} into the result')
                 else:
                     raise RuntimeError(f'unexpected diff node state for node {node_uuid}: {node_state}')
+            # the source dialog is not modified here, the destination set is kept in sync with every change
             destination_root_nodes = set(destination_dialog.get_root_nodes())
+            source_root_nodes = source_dialog.get_root_nodes()
+            source_root_nodes_order = source_dialog.get_root_nodes_order()
             for root_node_uuid, root_node_state in source_root_diff.items():
-                self.add_to_report(f'root dialog node {root_node_uuid}, diff {root_node_state}')
+                if self.__verbose_report:
+                    self.add_to_report(f'root dialog node {root_node_uuid}, diff {root_node_state}')
                 if root_node_uuid in destination_root_diff:
                     self.add_to_report(f'root dialog node {root_node_uuid} is already changed in higher priority mod, skipped')
                     continue
                 if root_node_state == dialog_differ.DELETED:
                     self.add_to_report(f'root dialog node {root_node_uuid} is deleted, removing it from the result')
                     destination_dialog.remove_root_node(root_node_uuid)
+                    destination_root_nodes.discard(root_node_uuid)
                 elif root_node_state == dialog_differ.ADDED or root_node_state == dialog_differ.MODIFIED:
-                    source_root_nodes = source_dialog.get_root_nodes()
-                    source_root_nodes_order = source_dialog.get_root_nodes_order()
                     # find the 'next' root in the source node that is after the 'modified' node
                     mod_node_idx = source_root_nodes_order[root_node_uuid] + 1
                     next_node_uuid = ''
@@ -1137,6 +1207,7 @@ class mod_manager:
                     if root_node_uuid in destination_root_nodes:
                         self.add_to_report(f'root dialog node {root_node_uuid}, removed existing entry from the result')
                         destination_dialog.remove_root_node(root_node_uuid)
+                        destination_root_nodes.discard(root_node_uuid)
                     if next_node_uuid == '':
                         # add to the tail if node is not found
                         destination_dialog.add_root_node(root_node_uuid)
@@ -1145,6 +1216,7 @@ class mod_manager:
                         # add before the 'next' node
                         destination_dialog.add_root_node_before(next_node_uuid, root_node_uuid)
                         self.add_to_report(f'root dialog node {root_node_uuid}, added to the result before {next_node_uuid}')
+                    destination_root_nodes.add(root_node_uuid)
                 else:
                     raise RuntimeError(f'unexpected dialog diff root node state for node {root_node_uuid}: {root_node_state}')
         except BaseException as exc:
@@ -1154,6 +1226,8 @@ class mod_manager:
 
 
     def __print_node_interval(self, node: XmlElement, what: str) -> None:
+        if not self.__verbose_report:
+            return
         node_uuid = get_required_bg3_attribute(node, 'ID')
         start = get_bg3_attribute(node, 'StartTime')
         if start is None:
@@ -1173,8 +1247,11 @@ class mod_manager:
         try:
             self.add_to_report(f'merging timeline nodes for {dialog_uuid}')
             self.add_to_report(f'destination timeline duration: {destination_timeline.duration}')
+            # has_phase() scans the Phases node with XPath, the main dialog node uuids are collected once instead
+            destination_phases = { destination_timeline.get_timeline_phase(i).dialog_node_uuid for i in range(destination_timeline.get_number_of_phases()) }
             for node_uuid, node_state in source_timeline_diff.items():
-                self.add_to_report(f'timeline node {node_uuid}, diff {node_state}')
+                if self.__verbose_report:
+                    self.add_to_report(f'timeline node {node_uuid}, diff {node_state}')
                 p = node_state.split('|')
                 node_state = p[0]
                 phase_uuid = p[1]
@@ -1185,18 +1262,21 @@ class mod_manager:
                     self.add_to_report(f'timeline node {node_uuid} is deleted in the source, removing it from the result')
                     destination_timeline.remove_effect_component(node_uuid)
                 elif node_state == timeline_differ.ADDED or node_state == timeline_differ.MODIFIED:
-                    if destination_timeline.has_phase(phase_uuid):
+                    source_phase = source_timeline.get_timeline_phase(phase_uuid)
+                    if phase_uuid in destination_phases:
                         destionation_phase = destination_timeline.use_existing_phase(phase_uuid)
                         self.add_to_report(f'timeline phase {phase_uuid} exists in the result, phase index {destionation_phase.index}')
                     else:
                         self.add_to_report(f'timeline phase {phase_uuid} does not exists in the result')
-                        source_phase = source_timeline.get_timeline_phase(phase_uuid)
-                        self.add_to_report(f'source phase {phase_uuid} starts at {source_phase.start}, ends at {source_phase.end}')
+                        if self.__verbose_report:
+                            self.add_to_report(f'source phase {phase_uuid} starts at {source_phase.start}, ends at {source_phase.end}')
                         destination_timeline.create_new_phase(source_phase.dialog_node_uuid, source_phase.duration, additional_nodes=source_phase.group_nodes_uuids)
                         destionation_phase = destination_timeline.use_existing_phase(phase_uuid)
+                        destination_phases.add(source_phase.dialog_node_uuid)
                         self.add_to_report(f'timeline phase {phase_uuid} was created in the result, phase index {destionation_phase.index}, source phase index {source_phase.index}')
-                        self.add_to_report(f'destination phase {phase_uuid} starts at {destionation_phase.start}, ends at {destionation_phase.end}')
-                        self.add_to_report(f'destination timeline duration: {destination_timeline.duration}')
+                        if self.__verbose_report:
+                            self.add_to_report(f'destination phase {phase_uuid} starts at {destionation_phase.start}, ends at {destionation_phase.end}')
+                            self.add_to_report(f'destination timeline duration: {destination_timeline.duration}')
                     
                     if destination_timeline.has_effect_component(node_uuid):
                         self.add_to_report(f'timeline phase {phase_uuid} in the result contains existing node {node_uuid}, removing it')
@@ -1204,7 +1284,6 @@ class mod_manager:
                     
                     effect_component = source_timeline.find_effect_component(node_uuid)
                     self.__print_node_interval(effect_component, 'source effect_component')
-                    source_phase = source_timeline.get_timeline_phase(phase_uuid)
                     normalized_node = timeline_differ.normalize_tl_node(effect_component, source_phase.start, source_phase.duration)
                     self.__print_node_interval(normalized_node, 'source normalized_node')
                     destination_node = timeline_differ.normalize_tl_node(normalized_node, destionation_phase.start.copy_negate())
@@ -1212,7 +1291,8 @@ class mod_manager:
                     set_bg3_attribute(destination_node, 'PhaseIndex', destionation_phase.index, attribute_type = 'int64')
 
 
-                    self.add_to_report(f'normalized node {node_uuid}, source start {source_phase.start}, start in the result {destionation_phase.start}')
+                    if self.__verbose_report:
+                        self.add_to_report(f'normalized node {node_uuid}, source start {source_phase.start}, start in the result {destionation_phase.start}')
                     destination_timeline.insert_new_tl_node(destination_node)
                     self.add_to_report(f'timeline phase {phase_uuid}, added node {node_uuid} to the result')
                 else:
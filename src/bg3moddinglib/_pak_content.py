@@ -118,6 +118,7 @@ class pak_content:
     __content_bundles: dict[str, content_bundle]
     __dialog_bank: dict[str, XmlElement]
     __timeline_bank: dict[str, XmlElement]
+    __bank_files: set[str]
     __meta_lsx: XmlElement | None
 
     def __init__(self, a: bg3_assets, file_path: str) -> None:
@@ -129,6 +130,7 @@ class pak_content:
         self.__content_bundles = dict[str, content_bundle]()
         self.__dialog_bank = dict[str, XmlElement]()
         self.__timeline_bank = dict[str, XmlElement]()
+        self.__bank_files = set[str]()
         self.__meta_lsx = None
         self.initialize()
 
@@ -221,9 +223,15 @@ class pak_content:
     def meta_lsx(self) -> XmlElement | None:
         return self.__meta_lsx
 
+    def is_resource_bank_file(self, file_path: str) -> bool:
+        return file_path in self.__bank_files
+
     def has_content_bundle(self, dialog_uuid: str) -> bool:
         return dialog_uuid.lower() in self.__content_bundles
 
+    def try_get_content_bundle(self, dialog_uuid: str) -> content_bundle | None:
+        return self.__content_bundles.get(dialog_uuid.lower())
+
     def get_content_bundle(self, dialog_uuid: str) -> content_bundle:
         dialog_uuid = dialog_uuid.lower()
         if dialog_uuid in self.__content_bundles:
@@ -277,6 +285,7 @@ class pak_content:
 
     def __read_dialog_bank_lsf(self, lsf_path: str) -> None:
         gf = game_file(self.__tool, lsf_path, pak_name = self.__pak_file_path)
+        self.__register_bank_file(lsf_path, gf)
         resources = gf.xml.getroot().findall('./region[@id="DialogBank"]/node[@id="DialogBank"]/children/node[@id="Resource"]')
         for resource in resources:
             dialog_file_uuid = get_required_bg3_attribute(resource, 'ID').lower()
@@ -287,6 +296,7 @@ class pak_content:
         
     def __read_timeline_bank_lsf(self, lsf_path: str) -> None:
         gf = game_file(self.__tool, lsf_path, pak_name = self.__pak_file_path)
+        self.__register_bank_file(lsf_path, gf)
         resources = gf.xml.getroot().findall('./region[@id="TimelineBank"]/node[@id="TimelineBank"]/children/node[@id="Resource"]')
         for resource in resources:
             timeline_file_uuid = get_required_bg3_attribute(resource, 'ID').lower()
@@ -295,4 +305,8 @@ class pak_content:
             filename = os.path.basename(source_file)[:-4]
             self.__timeline_bank[filename.lower()] = resource
 
-
+    def __register_bank_file(self, lsf_path: str, gf: game_file) -> None:
+        for region in gf.xml.getroot():
+            if region.tag == 'region' and region.get('id') in ('DialogBank', 'TimelineBank'):
+                self.__bank_files.add(lsf_path)
+                return
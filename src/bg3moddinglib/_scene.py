@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import numpy as np
 import xml.etree.ElementTree as et
 
 from ._common import (
+    find_bg3_attribute,
     get_bg3_attribute,
+    get_bg3_attribute_value,
     get_or_create_child_node,
     get_required_bg3_attribute,
     set_bg3_attribute,
     new_random_uuid,
     to_compact_string,
     put_object_into_map,
-    find_object_by_map_key
+    find_object_by_map_key,
+    vector_to_str
 )
 from ._files import game_file
 
@@ -18,16 +22,115 @@ from typing import Iterable
 
 DEFAULT_STAGE_UUID: str = '00000000-0000-0000-0000-000000000000'
 
+# element paths, shared by all scene objects
+LSF_SCENE_PATH = './region[@id="TLScene"]/node[@id="TLScene"]'
+LSX_SCENE_PATH = './region[@id="TLScene"]/node[@id="root"]'
+# paths below are relative to the TLScene children element of a scene document
+INHERITED_SCENES_PATH = './node[@id="TLInheritedScenes"]/children/node[@id="TLScene"]'
+ACTORS_CHILDREN_PATH = './node[@id="TLActors"]/children'
+CAMERAS_CHILDREN_PATH = './node[@id="TLCameras"]/children'
+CAMERA_NODES_PATH = './node[@id="TLCameras"]/children/node[@id="Object"]/children/node[@id="TLCameras"]'
+LIGHTING_SETUPS_PATH = './node[@id="LightingSetups"]/children/node[@id="LightingSetup"]'
+LIGHTS_PATH = './node[@id="Lights"]'
+ACTOR_TRANSFORM_PATH = './children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]'
+ACTOR_TRANSFORMS_PATH = './children/node[@id="Transforms"]/children/node[@id="Object"]'
+CAMERA_NODE_PATH = './children/node[@id="TLCameras"]'
+CAMERA_TRANSFORMS_PATH = './children/node[@id="Transform"]/children/node[@id="Object"]'
+SETUP_LIGHTS_PATH = './children/node[@id="Lights"]/children/node[@id="Light"]'
+LINKED_LIGHTS_PATH = './children/node[@id="TLCameras"]/children/node[@id="LinkedLights"]'
+CHILDREN_PATH = './children'
+CHILD_NODES_PATH = './children/node'
+MAP_VALUES_PATH = './node[@id="MapValue"]'
+MAP_OBJECTS_PATH = './children/node[@id="Object"]'
+MAP_VALUE_PATH = './children/node[@id="MapValue"]'
+TRANSFORMS_MAP_PATH = './children/node[@id="Transforms"]'
+TRANSFORM_MAP_PATH = './children/node[@id="Transform"]'
+LIGHT_NODE_PATH = './children/node[@id="Lights"]'
+LIGHT_DESC_PATH = './children/node[@id="Lights"]/children/node[@id="Desc"]'
+LSX_POSITION_PATH = './attribute[@id="Position"]/float3'
+ATTRIBUTES_PATH = './attribute'
+MAP_VALUE_ATTRIBUTE_PATH = './attribute[@id="MapValue"]'
+TRANSFORM_ATTRIBUTES = ('Position', 'RotationQuat', 'Scale')
+
 class scene_object:
 
+    # the instance only holds the declared state, no per-instance __dict__
+    __slots__ = (
+        '__lsf_file',
+        '__lsx_file',
+        '__current_stage_uuid',
+        '__lsf_root',
+        '__lsx_root',
+        '__lsf_scene_node',
+        '__lsx_scene_node',
+        '__lsf_scene',
+        '__lsx_scene',
+        '__documents',
+        '__anchors',
+        '__lsf_actors',
+        '__lsx_actors',
+        '__lsf_camera_objects',
+        '__lsx_camera_objects',
+        '__indexes',
+        '__stage_transforms',
+        '__actor_transforms',
+        '__lights',
+        '__light_dimensions',
+    )
+
     __lsf_file: game_file
     __lsx_file: game_file | None
     __current_stage_uuid: str | None
+    __lsf_root: et.Element
+    __lsx_root: et.Element | None
+    __lsf_scene_node: et.Element | None
+    __lsx_scene_node: et.Element | None
+    __lsf_scene: et.Element | None
+    __lsx_scene: et.Element | None
+    __documents: tuple[tuple[bool, game_file], ...]
+    __anchors: dict[tuple[str, bool], et.Element]
+    __lsf_actors: list[et.Element] | None
+    __lsx_actors: list[et.Element] | None
+    __lsf_camera_objects: list[et.Element] | None
+    __lsx_camera_objects: list[et.Element] | None
+    __indexes: dict[tuple[str, bool], dict[str, et.Element]]
+    __stage_transforms: dict[et.Element, dict[str, et.Element | None]]
+    __actor_transforms: dict[et.Element, et.Element]
+    __lights: dict[tuple[bool, str], dict[str, et.Element]]
+    __light_dimensions: dict[tuple[bool, str], et.Element]
 
     def __init__(self, lsf_file: game_file, lsx_file: game_file | None = None) -> None:
         self.__lsf_file = lsf_file
         self.__lsx_file = lsx_file
         self.__current_stage_uuid = None
+        # document roots, exposed as lsf_xml and lsx_xml
+        self.__lsf_root = lsf_file.root_node
+        self.__lsx_root = lsx_file.root_node if lsx_file is not None else None
+        # every element of interest lives under TLScene/children, see __find_scene_children()
+        self.__lsf_scene_node = self.__lsf_root.find(LSF_SCENE_PATH)
+        self.__lsx_scene_node = self.__lsx_root.find(LSX_SCENE_PATH) if self.__lsx_root is not None else None
+        self.__lsf_scene = None
+        self.__lsx_scene = None
+        # (lsx, file) of every loaded document, mutators apply the same change to each of them
+        self.__documents = ((False, lsf_file),)
+        if lsx_file is not None:
+            self.__documents += ((True, lsx_file),)
+        # fixed container elements under the scene children, see __find_anchor()
+        self.__anchors = dict[tuple[str, bool], et.Element]()
+        # actors and cameras are looked up lazily, create_new_actor() resets the actor lists
+        self.__lsf_actors = None
+        self.__lsx_actors = None
+        self.__lsf_camera_objects = None
+        self.__lsx_camera_objects = None
+        # uuid -> element indexes, built on first use, see __get_index()
+        self.__indexes = dict[tuple[str, bool], dict[str, et.Element]]()
+        # stage transforms per camera element, __put_transform_into_stage_element() drops the entry it changes
+        self.__stage_transforms = dict[et.Element, dict[str, et.Element | None]]()
+        # first transform MapValue per actor element, dropped the same way as the stage transforms
+        self.__actor_transforms = dict[et.Element, et.Element]()
+        self.__lights = dict[tuple[bool, str], dict[str, et.Element]]()
+        # DirectionLightDimensions node per light, see __get_light_dimensions()
+        self.__light_dimensions = dict[tuple[bool, str], et.Element]()
 
     @property
     def current_stage_uuid(self) -> str:
@@ -45,26 +148,225 @@ class scene_object:
 
     @property
     def lsf_xml(self) -> et.Element:
-        return self.__lsf_file.root_node
+        return self.__lsf_root
 
     @property
     def lsx_xml(self) -> et.Element | None:
-        if self.__lsx_file is not None:
-            return self.__lsx_file.root_node
-        return None
+        return self.__lsx_root
+
+    def __find_scene_children(self, lsx: bool = False) -> et.Element | None:
+        # TLScene/children of an empty scene may be missing, it is created by the first change that needs it
+        scene_children = self.__lsx_scene if lsx else self.__lsf_scene
+        if scene_children is None:
+            if lsx and self.__lsx_root is None:
+                raise RuntimeError('LSX is None')
+            scene_node = self.__lsx_scene_node if lsx else self.__lsf_scene_node
+            if scene_node is not None:
+                scene_children = scene_node.find(CHILDREN_PATH)
+                if scene_children is not None:
+                    self.__set_scene_children(scene_children, lsx)
+        return scene_children
+
+    def __get_or_create_scene_children(self, lsx: bool = False) -> et.Element:
+        scene_children = self.__find_scene_children(lsx)
+        if scene_children is None:
+            scene_node = self.__lsx_scene_node if lsx else self.__lsf_scene_node
+            if scene_node is None:
+                raise ValueError(f"{self.__document_file(lsx).relative_file_path} is not a valid scene")
+            scene_children = et.SubElement(scene_node, 'children')
+            self.__set_scene_children(scene_children, lsx)
+        return scene_children
+
+    def __set_scene_children(self, scene_children: et.Element, lsx: bool) -> None:
+        if lsx:
+            self.__lsx_scene = scene_children
+        else:
+            self.__lsf_scene = scene_children
+
+    def __find_anchor(self, path: str, lsx: bool = False) -> et.Element | None:
+        # containers are never moved or removed once they exist, only misses are looked up again
+        anchor = self.__anchors.get((path, lsx))
+        if anchor is None:
+            scene_children = self.__find_scene_children(lsx)
+            if scene_children is None:
+                return None
+            anchor = scene_children.find(path)
+            if anchor is not None:
+                self.__anchors[(path, lsx)] = anchor
+        return anchor
+
+    def __ensure_container(self, container_id: str, lsx: bool = False) -> et.Element:
+        # returns the children of a fixed container, the container and its children are created when missing
+        children_path = f'./node[@id="{container_id}"]/children'
+        children = self.__find_anchor(children_path, lsx)
+        if children is None:
+            container = self.__find_anchor(f'./node[@id="{container_id}"]', lsx)
+            if container is None:
+                container = et.SubElement(self.__get_or_create_scene_children(lsx), 'node', id = container_id)
+            children = et.SubElement(container, 'children')
+            self.__anchors[(children_path, lsx)] = children
+        return children
+
+    @staticmethod
+    def __child_nodes(children: et.Element | None, node_id: str) -> list[et.Element]:
+        # one tag and id comparison per child of the cached container instead of a predicate path from the scene
+        if children is None:
+            return []
+        return [node for node in children if node.tag == 'node' and node.get('id') == node_id]
+
+    def __get_actors(self, lsx: bool = False) -> list[et.Element]:
+        actors = self.__lsx_actors if lsx else self.__lsf_actors
+        if actors is None:
+            actors = scene_object.__child_nodes(self.__find_anchor(ACTORS_CHILDREN_PATH, lsx), 'TLActor')
+            if lsx:
+                self.__lsx_actors = actors
+            else:
+                self.__lsf_actors = actors
+        return actors
+
+    def __get_camera_objects(self, lsx: bool = False) -> list[et.Element]:
+        cameras = self.__lsx_camera_objects if lsx else self.__lsf_camera_objects
+        if cameras is None:
+            cameras = scene_object.__child_nodes(self.__find_anchor(CAMERAS_CHILDREN_PATH, lsx), 'Object')
+            if lsx:
+                self.__lsx_camera_objects = cameras
+            else:
+                self.__lsf_camera_objects = cameras
+        return cameras
+
+    @staticmethod
+    def __build_index(nodes: Iterable[et.Element], attribute_name: str) -> dict[str, et.Element]:
+        # the first node with a given key wins, the same node a linear scan would find
+        index = dict[str, et.Element]()
+        for node in nodes:
+            key = get_bg3_attribute_value(node, attribute_name)
+            if key is not None:
+                index.setdefault(key, node)
+        return index
+
+    def __get_index(self, kind: str, lsx: bool = False) -> dict[str, et.Element]:
+        index = self.__indexes.get((kind, lsx))
+        if index is not None:
+            return index
+        scene = self.__find_scene_children(lsx)
+        if kind == 'actors':
+            index = scene_object.__build_index(self.__get_actors(lsx), 'TemplateId')
+        elif kind == 'cameras':
+            index = scene_object.__build_index(self.__get_camera_objects(lsx), 'MapKey')
+        elif kind == 'camera nodes':
+            index = scene_object.__build_index(scene.iterfind(CAMERA_NODES_PATH) if scene is not None else (), 'Identifier')
+        elif kind == 'lights':
+            lights = self.__find_anchor(LIGHTS_PATH, lsx)
+            if lights is None:
+                raise RuntimeError(f'No lights defined in scene {self.__lsf_file.relative_file_path}')
+            index = scene_object.__build_index(lights.iterfind(MAP_OBJECTS_PATH), 'MapKey')
+        elif kind == 'lighting setups':
+            index = scene_object.__build_index(scene.iterfind(LIGHTING_SETUPS_PATH) if scene is not None else (), 'Id')
+        else:
+            raise ValueError(f'unknown index {kind}')
+        self.__indexes[(kind, lsx)] = index
+        return index
 
     def get_inherited_scenes(self) -> list[str]:
-        result = list[str]()
-        scenes = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLInheritedScenes"]/children/node[@id="TLScene"]')
-        for scene in scenes:
-            scene_file = get_required_bg3_attribute(scene, 'Object')
-            if scene_file.endswith('.lsx'):
-                scene_file = scene_file[:-4] + '.lsf'
-            result.append(scene_file)
-        return result
+        scene_children = self.__find_scene_children()
+        if scene_children is None:
+            return []
+        scene_files = [get_required_bg3_attribute(scene, 'Object') for scene in scene_children.iterfind(INHERITED_SCENES_PATH)]
+        return [scene_file[:-4] + '.lsf' if scene_file.endswith('.lsx') else scene_file for scene_file in scene_files]
+
+    def __document_file(self, lsx: bool) -> game_file:
+        # only used to name the file in error messages, so the happy path never touches it
+        return self.__lsx_file if lsx and self.__lsx_file is not None else self.__lsf_file
+
+    def __get_actor_transform(self, index: int, what: str, lsx: bool = False) -> et.Element:
+        actors = self.__get_actors(lsx)
+        if index >= len(actors):
+            raise KeyError(f'There is no actor with index {index} in {self.__document_file(lsx).relative_file_path}')
+        actor = actors[index]
+        transform = self.__actor_transforms.get(actor)
+        if transform is None:
+            transform = actor.find(ACTOR_TRANSFORM_PATH)
+            if transform is None:
+                raise RuntimeError(f'Failed to determine {what} of an actor with index {index} in {self.__document_file(lsx).relative_file_path}')
+            self.__actor_transforms[actor] = transform
+        return transform
+
+    @staticmethod
+    def __put_lsx_vector_attribute(
+            node: et.Element,
+            attribute_name: str,
+            attribute_type: str,
+            vector_tag: str,
+            values: tuple[str | float, ...]
+    ) -> None:
+        # update the components in place, the attribute is only rebuilt when it is missing or has another shape
+        attribute_node = find_bg3_attribute(node, attribute_name)
+        if attribute_node is not None:
+            if len(attribute_node) == 1 and attribute_node[0].tag == vector_tag:
+                attribute_node.set('type', attribute_type)
+                vector_node = attribute_node[0]
+                for component, value in zip('xyzw', values):
+                    vector_node.set(component, f'{value}')
+                return
+            node.remove(attribute_node)
+        scene_object.__add_lsx_vector_attribute(node, attribute_name, attribute_type, vector_tag, values)
+
+    @staticmethod
+    def __add_attribute(node: et.Element, attribute_name: str, attribute_type: str, value: str) -> et.Element:
+        # new elements are built directly, there is no need to go through the XML parser
+        return et.SubElement(node, 'attribute', id = attribute_name, type = attribute_type, value = value)
+
+    @staticmethod
+    def __add_lsx_vector_attribute(
+            node: et.Element,
+            attribute_name: str,
+            attribute_type: str,
+            vector_tag: str,
+            values: tuple[str | float, ...]
+    ) -> et.Element:
+        attribute_node = et.SubElement(node, 'attribute', id = attribute_name, type = attribute_type)
+        et.SubElement(attribute_node, vector_tag, dict(zip('xyzw', (f'{v}' for v in values))))
+        return attribute_node
+
+    @staticmethod
+    def __get_vector_components(attribute_node: et.Element, attribute_name: str) -> tuple[str, ...]:
+        value = attribute_node.get('value')
+        if value is not None:
+            return tuple(value.split(' '))
+        # lsx keeps the components in a float3 / float4 child, take them as they are
+        if len(attribute_node) != 1:
+            raise ValueError(f"required BG3 attribute {attribute_name} doesn't have a value")
+        inner_node = attribute_node[0]
+        return tuple(v for v in (inner_node.get(c) for c in 'xyzw') if v is not None)
+
+    @staticmethod
+    def __read_vector(node: et.Element, attribute_name: str) -> tuple[str, ...]:
+        attribute_node = find_bg3_attribute(node, attribute_name)
+        if attribute_node is None:
+            raise ValueError(f"required BG3 attribute {attribute_name} doesn't exist")
+        return scene_object.__get_vector_components(attribute_node, attribute_name)
+
+    @staticmethod
+    def __read_transform(transform: et.Element) -> tuple[tuple[str, ...], tuple[str, ...], str]:
+        # collect position, rotation and scale in a single pass over the attributes
+        attribute_nodes = dict[str, et.Element]()
+        for attribute_node in transform.iterfind(ATTRIBUTES_PATH):
+            attribute_name = attribute_node.get('id')
+            if attribute_name in TRANSFORM_ATTRIBUTES and attribute_name not in attribute_nodes:
+                attribute_nodes[attribute_name] = attribute_node
+        for attribute_name in TRANSFORM_ATTRIBUTES:
+            if attribute_name not in attribute_nodes:
+                raise ValueError(f"required BG3 attribute {attribute_name} doesn't exist")
+        scale = attribute_nodes['Scale'].get('value')
+        if scale is None:
+            raise ValueError("required BG3 attribute Scale doesn't have a value")
+        return (
+            scene_object.__get_vector_components(attribute_nodes['Position'], 'Position'),
+            scene_object.__get_vector_components(attribute_nodes['RotationQuat'], 'RotationQuat'),
+            scale)
 
     def get_actor_type(self, index: int) -> int:
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
+        actors = self.__get_actors()
         if index >= len(actors):
             raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
         actor_type = get_bg3_attribute(actors[index], 'ActorType')
@@ -73,271 +375,194 @@ class scene_object:
         return 0
 
     def get_number_of_actors(self) -> int:
-        return len(self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]'))
+        return len(self.__get_actors())
 
     def get_actor_position(self, index: int) -> tuple[str, str, str]:
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine position of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        position = get_required_bg3_attribute(transform, 'Position')
-        positions = position.split(' ')
+        transform = self.__get_actor_transform(index, 'position')
+        positions = scene_object.__read_vector(transform, 'Position')
         if len(positions) != 3:
             raise RuntimeError(f'Unexpected number ({len(positions)}) of components in position, actor index {index}, scene file {self.__lsf_file.relative_file_path}')
         return (positions[0], positions[1], positions[2])
 
     def set_actor_position(self, index: int, pos: tuple[str | float, str | float, str | float]) -> None:
-        # update lsf
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine position of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            actors = self.__lsx_file.root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            if index >= len(actors):
-                raise KeyError(f'There is no actor with index {index} in {self.__lsx_file.relative_file_path}')
-            actor = actors[index]
-            transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsx_file.relative_file_path}')
-            attr = transform.find('./attribute[@id="Position"]')
-            if attr is not None:
-                transform.remove(attr)
-            transform.append(et.fromstring(f'<attribute id="Position" type="fvec3"><float3 x="{pos[0]}" y="{pos[1]}" z="{pos[2]}" /></attribute>'))
+        self.__write_actor_transform(index, pos = pos)
 
     def get_actor_rotation(self, index: int) -> tuple[str, str, str, str]:
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine rotation of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        rotation = get_required_bg3_attribute(transform, 'RotationQuat')
-        rotations = rotation.split(' ')
+        transform = self.__get_actor_transform(index, 'rotation')
+        rotations = scene_object.__read_vector(transform, 'RotationQuat')
         if len(rotations) != 4:
             raise RuntimeError(f'Unexpected number ({len(rotations)}) of components in rotation, actor index {index}, scene file {self.__lsf_file.relative_file_path}')
         return (rotations[0], rotations[1], rotations[2], rotations[3])
 
     def set_actor_rotation(self, index: int, rot: tuple[str | float, str | float, str | float, str | float]) -> None:
-        # update lsf
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine rotation of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            actors = self.__lsx_file.root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            if index >= len(actors):
-                raise KeyError(f'There is no actor with index {index} in {self.__lsx_file.relative_file_path}')
-            actor = actors[index]
-            transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsx_file.relative_file_path}')
-            attr = transform.find('./attribute[@id="RotationQuat"]')
-            if attr is not None:
-                transform.remove(attr)
-            transform.append(et.fromstring(f'<attribute id="RotationQuat" type="fvec4"><float3 x="{rot[0]}" y="{rot[1]}" z="{rot[2]}" w="{rot[3]}" /></attribute>'))
+        self.__write_actor_transform(index, rot = rot)
 
     def get_actor_scale(self, index: int) -> str:
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine scale of an actor with index {index} in {self.__lsf_file.relative_file_path}')
+        transform = self.__get_actor_transform(index, 'scale')
         return get_required_bg3_attribute(transform, 'Scale')
 
     def set_actor_scale(self, index: int, scale: str) -> None:
-        # update lsf
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine rotation of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            actors = self.__lsx_file.root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            if index >= len(actors):
-                raise KeyError(f'There is no actor with index {index} in {self.__lsx_file.relative_file_path}')
-            actor = actors[index]
-            transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsx_file.relative_file_path}')
-            set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
-
-    def get_actor_transform(self, index: int) -> tuple[tuple[str, str, str], tuple[str, str, str, str], str]:
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        position = get_required_bg3_attribute(transform, 'Position')
-        positions = position.split(' ')
+        self.__write_actor_transform(index, scale = scale)
+
+    def get_actor_transform_at(self, index: int) -> tuple[tuple[str, str, str], tuple[str, str, str, str], str]:
+        return self.__read_actor_transform(index)
+
+    def get_actor_transforms(self) -> list[tuple[tuple[str, str, str], tuple[str, str, str, str], str]]:
+        # transforms of all actors in index order, the counterpart of set_actor_transforms()
+        return [self.__read_actor_transform(index) for index in range(len(self.__get_actors()))]
+
+    def get_actor_transforms_array(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # positions (N, 3), rotations (N, 4) and scales (N,) of all actors, float64 keeps the written values exact
+        return scene_object.__transforms_to_arrays(self.get_actor_transforms())
+
+    @staticmethod
+    def __transforms_to_arrays(
+            transforms: list[tuple[tuple[str, str, str], tuple[str, str, str, str], str]]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        positions = np.array([pos for pos, _, _ in transforms], dtype = np.float64).reshape(-1, 3)
+        rotations = np.array([rot for _, rot, _ in transforms], dtype = np.float64).reshape(-1, 4)
+        scales = np.array([scale for _, _, scale in transforms], dtype = np.float64)
+        return (positions, rotations, scales)
+
+    def set_actor_transforms_array(self, positions: np.ndarray, rotations: np.ndarray, scales: np.ndarray) -> None:
+        count = len(self.__get_actors())
+        if np.shape(positions) != (count, 3) or np.shape(rotations) != (count, 4) or np.shape(scales) != (count,):
+            raise ValueError(f'expected transforms of {count} actors, got {np.shape(positions)}, {np.shape(rotations)}, {np.shape(scales)}')
+        # only changed values are written, unchanged components keep their text, e.g. 1 is not rewritten as 1.0
+        positions = np.asarray(positions, dtype = np.float64)
+        rotations = np.asarray(rotations, dtype = np.float64)
+        scales = np.asarray(scales, dtype = np.float64)
+        current = self.get_actor_transforms()
+        current_positions, current_rotations, current_scales = scene_object.__transforms_to_arrays(current)
+        positions_changed = positions != current_positions
+        rotations_changed = rotations != current_rotations
+        scales_changed = scales != current_scales
+        for index in np.flatnonzero(positions_changed.any(axis = 1) | rotations_changed.any(axis = 1) | scales_changed).tolist():
+            current_pos, current_rot, _ = current[index]
+            # changed values are written as the shortest repr of the float64
+            self.__write_actor_transform(
+                index,
+                pos = scene_object.__merge_components(current_pos, positions[index], positions_changed[index]),
+                rot = scene_object.__merge_components(current_rot, rotations[index], rotations_changed[index]),
+                scale = scales[index].item() if scales_changed[index] else None)
+
+    @staticmethod
+    def __merge_components(current: tuple[str, ...], values: np.ndarray, changed: np.ndarray) -> tuple[str | float, ...] | None:
+        if not changed.any():
+            return None
+        return tuple(value if is_changed else text for text, value, is_changed in zip(current, values.tolist(), changed.tolist()))
+
+    def __read_actor_transform(self, index: int) -> tuple[tuple[str, str, str], tuple[str, str, str, str], str]:
+        transform = self.__get_actor_transform(index, 'transform')
+        positions, rotations, scale = scene_object.__read_transform(transform)
         if len(positions) != 3:
             raise RuntimeError(f'Unexpected number ({len(positions)}) of components in position, actor index {index}, scene file {self.__lsf_file.relative_file_path}')
-        rotation = get_required_bg3_attribute(transform, 'RotationQuat')
-        rotations = rotation.split(' ')
         if len(rotations) != 4:
             raise RuntimeError(f'Unexpected number ({len(rotations)}) of components in rotation, actor index {index}, scene file {self.__lsf_file.relative_file_path}')
-        scale = get_required_bg3_attribute(transform, 'Scale')
         return ((positions[0], positions[1], positions[2]), (rotations[0], rotations[1], rotations[2], rotations[3]), scale)
 
-    def set_actor_transform(self, index: int, pos: tuple[str, str, str], rot: tuple[str, str, str, str], scale: str) -> None:
-        # update lsf
-        actors = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-        if index >= len(actors):
-            raise KeyError(f'There is no actor with index {index} in {self.__lsf_file.relative_file_path}')
-        actor = actors[index]
-        transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-        if transform is None:
-            raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-        set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-        set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
+    def set_actor_transform_at(self, index: int, pos: tuple[str, str, str], rot: tuple[str, str, str, str], scale: str) -> None:
+        self.__write_actor_transform(index, pos = pos, rot = rot, scale = scale)
 
-        # update lsx
-        if self.__lsx_file is not None:
-            actors = self.__lsx_file.root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            if index >= len(actors):
-                raise KeyError(f'There is no actor with index {index} in {self.__lsx_file.relative_file_path}')
-            actor = actors[index]
-            transform = actor.find('./children/node[@id="Transforms"]/children/node[@id="Object"]/children/node[@id="MapValue"]')
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of an actor with index {index} in {self.__lsx_file.relative_file_path}')
-            all_attrs = transform.findall('./attribute')
-            for attr in all_attrs:
-                transform.remove(attr)
-            transform.append(et.fromstring(f'<attribute id="Position" type="fvec3"><float3 x="{pos[0]}" y="{pos[1]}" z="{pos[2]}" /></attribute>'))
-            transform.append(et.fromstring(f'<attribute id="RotationQuat" type="fvec4"><float3 x="{rot[0]}" y="{rot[1]}" z="{rot[2]}" w="{rot[3]}" /></attribute>'))
-            transform.append(et.fromstring(f'<attribute id="Scale" type="float" value="{scale}" />'))
+    def set_actor(
+            self,
+            index: int,
+            /,
+            pos: tuple[str | float, str | float, str | float] | None = None,
+            rot: tuple[str | float, str | float, str | float, str | float] | None = None,
+            scale: str | float | None = None
+    ) -> None:
+        self.__write_actor_transform(index, pos = pos, rot = rot, scale = scale)
+
+    def set_actor_transforms(self, updates: Iterable[tuple[int, tuple[str, str, str], tuple[str, str, str, str], str]]) -> None:
+        # the actor lists are resolved once and shared by all updates
+        for index, pos, rot, scale in sorted(updates, key = lambda update: update[0]):
+            self.__write_actor_transform(index, pos = pos, rot = rot, scale = scale)
+
+    def __write_actor_transform(
+            self,
+            index: int,
+            /,
+            pos: tuple[str | float, str | float, str | float] | None = None,
+            rot: tuple[str | float, str | float, str | float, str | float] | None = None,
+            scale: str | float | None = None
+    ) -> None:
+        # resolve both transforms before writing anything, so a missing lsx actor leaves the lsf untouched
+        transform_lsf = self.__get_actor_transform(index, 'transform')
+        transform_lsx = self.__get_actor_transform(index, 'transform', True) if self.__lsx_file is not None else None
+        scene_object.__write_transform(transform_lsf, transform_lsx, pos, rot, scale)
 
     def is_attached_camera(self, index: int) -> bool:
-        cameras = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLCameras"]/children/node[@id="Object"]')
+        cameras = self.__get_camera_objects()
         if index >= len(cameras):
             raise KeyError(f'There is no camera with index {index} in {self.__lsf_file.relative_file_path}')
-        camera = cameras[index].find('./children/node[@id="TLCameras"]')
+        camera = cameras[index].find(CAMERA_NODE_PATH)
         if camera is None:
             raise KeyError(f'Failed to find a camera with index {index} in {self.__lsf_file.relative_file_path}')
         return get_bg3_attribute(camera, 'AttachTo') is not None
 
     def get_cameras(self) -> list[et.Element[str]]:
-        return self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLCameras"]/children/node[@id="Object"]')
+        return list(self.__get_camera_objects())
 
     def get_camera(self, camera_id: str | int, lsx: bool = False) -> et.Element[str]:
         if lsx:
             if self.__lsx_file is None:
                 raise RuntimeError('LSX is None')
-            cameras = self.__lsx_file.root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLCameras"]/children/node[@id="Object"]')
+            cameras = self.__get_camera_objects(True)
         else:    
-            cameras = self.lsf_xml.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLCameras"]/children/node[@id="Object"]')
+            cameras = self.__get_camera_objects()
         if isinstance(camera_id, int):
             if camera_id >= len(cameras):
                 raise KeyError(f'There is no camera with index {camera_id} in {self.__lsf_file.relative_file_path}')
-            camera = cameras[camera_id].find('./children/node[@id="TLCameras"]')
+            camera = cameras[camera_id].find(CAMERA_NODE_PATH)
             if camera is None:
                 raise KeyError(f'Failed to find a camera with index {camera_id} in {self.__lsf_file.relative_file_path}')
             return camera
-        for camera in cameras:
-            if camera_id == get_required_bg3_attribute(camera, 'MapKey'):
-                result = camera.find('./children/node[@id="TLCameras"]')
-                if result is None:
-                    raise RuntimeError(f'bad camera: {camera_id}')
-                return result
-        raise RuntimeError(f'camera does not exist: {camera_id}')
+        camera = self.__get_index('cameras', lsx).get(camera_id)
+        if camera is None:
+            raise RuntimeError(f'camera does not exist: {camera_id}')
+        result = camera.find(CAMERA_NODE_PATH)
+        if result is None:
+            raise RuntimeError(f'bad camera: {camera_id}')
+        return result
 
     def get_number_of_cameras(self) -> int:
-        return len(self.get_cameras())
+        return len(self.__get_camera_objects())
 
     def __get_transform_element_by_stage_uuid(self, camera: et.Element[str], stage_uuid: str) -> et.Element[str] | None:
-        transforms = camera.findall('./children/node[@id="Transform"]/children/node[@id="Object"]')
-        for transform in transforms:
-            if stage_uuid == get_required_bg3_attribute(transform, 'MapKey'):
-                return transform.find('./children/node[@id="MapValue"]')
-        return None
+        transforms = self.__stage_transforms.get(camera)
+        if transforms is None:
+            transforms = dict[str, et.Element | None]()
+            for transform in camera.iterfind(CAMERA_TRANSFORMS_PATH):
+                transforms.setdefault(get_required_bg3_attribute(transform, 'MapKey'), transform.find(MAP_VALUE_PATH))
+            self.__stage_transforms[camera] = transforms
+        return transforms.get(stage_uuid)
 
     def get_camera_position(self, camera_id: str | int, stage_uuid: str = DEFAULT_STAGE_UUID) -> tuple[str, str, str]:
         camera = self.get_camera(camera_id)
         transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
         if transform is None:
             raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        position = get_required_bg3_attribute(transform, 'Position')
-        positions = position.split(' ')
+        positions = scene_object.__read_vector(transform, 'Position')
         if len(positions) != 3:
             raise RuntimeError(f'Unexpected number ({len(positions)}) of components in position, camera {camera_id}, scene file {self.__lsf_file.relative_file_path}')
         return (positions[0], positions[1], positions[2])
 
     def set_camera_position(self, camera_id: str | int, pos: tuple[str, str, str], stage_uuid: str = DEFAULT_STAGE_UUID) -> None:
-        # update lsf
-        camera = self.get_camera(camera_id)
-        transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-        if transform is None:
-            raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            camera = self.get_camera(camera_id, True)
-            transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-            set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-            # attr = transform.find('./attribute[@id="Position"]')
-            # if attr is not None:
-            #     transform.remove(attr)
-            # transform.append(et.fromstring(f'<attribute id="Position" type="fvec3"><float3 x="{pos[0]}" y="{pos[1]}" z="{pos[2]}" /></attribute>'))
+        self.__write_camera_transform(camera_id, stage_uuid, pos = pos)
 
     def get_camera_rotation(self, camera_id: str | int, stage_uuid: str = DEFAULT_STAGE_UUID) -> tuple[str, str, str, str]:
         camera = self.get_camera(camera_id)
         transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
         if transform is None:
             raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        rotation = get_required_bg3_attribute(transform, 'RotationQuat')
-        rotations = rotation.split(' ')
+        rotations = scene_object.__read_vector(transform, 'RotationQuat')
         if len(rotations) != 4:
             raise RuntimeError(f'Unexpected number ({len(rotations)}) of components in rotation, camera {camera_id}, scene file {self.__lsf_file.relative_file_path}')
         return (rotations[0], rotations[1], rotations[2], rotations[3])
 
     def set_camera_rotation(self, camera_id: str | int, rot: tuple[str, str, str, str], stage_uuid: str = DEFAULT_STAGE_UUID) -> None:
-        # update lsf
-        camera = self.get_camera(camera_id)
-        transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-        if transform is None:
-            raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            camera = self.get_camera(camera_id, True)
-            transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-            set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-            # attr = transform.find('./attribute[@id="RotationQuat"]')
-            # if attr is not None:
-            #     transform.remove(attr)
-            # transform.append(et.fromstring(f'<attribute id="RotationQuat" type="fvec4"><float3 x="{rot[0]}" y="{rot[1]}" z="{rot[2]}" w="{rot[3]}" /></attribute>'))
+        self.__write_camera_transform(camera_id, stage_uuid, rot = rot)
 
     def get_camera_scale(self, camera_id: str | int, stage_uuid: str = DEFAULT_STAGE_UUID) -> str:
         camera = self.get_camera(camera_id)
@@ -347,35 +572,18 @@ class scene_object:
         return get_required_bg3_attribute(transform, 'Scale')
 
     def set_camera_scale(self, camera_id: str | int, scale: str, stage_uuid: str = DEFAULT_STAGE_UUID) -> None:
-        # update lsf
-        camera = self.get_camera(camera_id)
-        transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-        if transform is None:
-            raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
-
-        # update lsx
-        if self.__lsx_file is not None:
-            camera = self.get_camera(camera_id)
-            transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-            set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
+        self.__write_camera_transform(camera_id, stage_uuid, scale = scale)
 
     def get_camera_transform(self, camera_id: str | int, stage_uuid: str = DEFAULT_STAGE_UUID) -> tuple[tuple[str, str, str], tuple[str, str, str, str], str]:
         camera = self.get_camera(camera_id)
         transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
         if transform is None:
             raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        position = get_required_bg3_attribute(transform, 'Position')
-        positions = position.split(' ')
+        positions, rotations, scale = scene_object.__read_transform(transform)
         if len(positions) != 3:
             raise RuntimeError(f'Unexpected number ({len(positions)}) of components in position, camera {camera_id}, scene file {self.__lsf_file.relative_file_path}')
-        rotation = get_required_bg3_attribute(transform, 'RotationQuat')
-        rotations = rotation.split(' ')
         if len(rotations) != 4:
             raise RuntimeError(f'Unexpected number ({len(rotations)}) of components in rotation, camera {camera_id}, scene file {self.__lsf_file.relative_file_path}')
-        scale = get_required_bg3_attribute(transform, 'Scale')
         return ((positions[0], positions[1], positions[2]), (rotations[0], rotations[1], rotations[2], rotations[3]), scale)
 
     def set_camera_transform(
@@ -386,30 +594,74 @@ class scene_object:
             scale: str,
             stage_uuid: str = DEFAULT_STAGE_UUID
     ) -> None:
-        # update lsf
+        self.__write_camera_transform(camera_id, stage_uuid, pos = pos, rot = rot, scale = scale)
+
+    def set_camera(
+            self,
+            camera_id: str | int,
+            /,
+            pos: tuple[str | float, str | float, str | float] | None = None,
+            rot: tuple[str | float, str | float, str | float, str | float] | None = None,
+            scale: str | float | None = None,
+            stage_uuid: str = DEFAULT_STAGE_UUID
+    ) -> None:
+        self.__write_camera_transform(camera_id, stage_uuid, pos = pos, rot = rot, scale = scale)
+
+    def set_camera_transforms(
+            self,
+            updates: Iterable[tuple[str | int, tuple[str, str, str], tuple[str, str, str, str], str]],
+            stage_uuid: str = DEFAULT_STAGE_UUID
+    ) -> None:
+        for camera_id, pos, rot, scale in updates:
+            self.__write_camera_transform(camera_id, stage_uuid, pos = pos, rot = rot, scale = scale)
+
+    def __write_camera_transform(
+            self,
+            camera_id: str | int,
+            stage_uuid: str,
+            /,
+            pos: tuple[str | float, str | float, str | float] | None = None,
+            rot: tuple[str | float, str | float, str | float, str | float] | None = None,
+            scale: str | float | None = None
+    ) -> None:
+        # resolve both transforms before writing anything, so a missing lsx camera leaves the lsf untouched
         camera = self.get_camera(camera_id)
-        transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-        if transform is None:
+        transform_lsf = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
+        if transform_lsf is None:
             raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-        set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-        set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
-
-        # update lsx
+        transform_lsx = None
         if self.__lsx_file is not None:
-            camera = self.get_camera(camera_id)
-            transform = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
-            if transform is None:
-                raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsf_file.relative_file_path}')
-            set_bg3_attribute(transform, 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-            set_bg3_attribute(transform, 'RotationQuat', f'{rot[0]} {rot[1]} {rot[2]} {rot[3]}', attribute_type = 'fvec4')
-            set_bg3_attribute(transform, 'Scale', f'{scale}', attribute_type = 'float')
-            # all_attrs = transform.findall('./attribute')
-            # for attr in all_attrs:
-            #     transform.remove(attr)
-            # transform.append(et.fromstring(f'<attribute id="Position" type="fvec3"><float3 x="{pos[0]}" y="{pos[1]}" z="{pos[2]}" /></attribute>'))
-            # transform.append(et.fromstring(f'<attribute id="RotationQuat" type="fvec4"><float3 x="{rot[0]}" y="{rot[1]}" z="{rot[2]}" w="{rot[3]}" /></attribute>'))
-            # transform.append(et.fromstring(f'<attribute id="Scale" type="float" value="{scale}" />'))
+            camera = self.get_camera(camera_id, True)
+            transform_lsx = self.__get_transform_element_by_stage_uuid(camera, stage_uuid)
+            if transform_lsx is None:
+                raise RuntimeError(f'Failed to determine transform of a camera {camera_id} in {self.__lsx_file.relative_file_path}')
+        scene_object.__write_transform(transform_lsf, transform_lsx, pos, rot, scale)
+
+    @staticmethod
+    def __write_transform(
+            transform_lsf: et.Element,
+            transform_lsx: et.Element | None,
+            pos: tuple[str | float, str | float, str | float] | None,
+            rot: tuple[str | float, str | float, str | float, str | float] | None,
+            scale: str | float | None
+    ) -> None:
+        # shared by actors and cameras, components are formatted once and used for both the lsf and lsx writes
+        # lsx vectors are float3/float4 child elements, they are updated in place
+        if pos is not None:
+            pos = tuple(map(str, pos))
+            set_bg3_attribute(transform_lsf, 'Position', vector_to_str(pos), attribute_type = 'fvec3')
+            if transform_lsx is not None:
+                scene_object.__put_lsx_vector_attribute(transform_lsx, 'Position', 'fvec3', 'float3', pos)
+        if rot is not None:
+            rot = tuple(map(str, rot))
+            set_bg3_attribute(transform_lsf, 'RotationQuat', vector_to_str(rot), attribute_type = 'fvec4')
+            if transform_lsx is not None:
+                scene_object.__put_lsx_vector_attribute(transform_lsx, 'RotationQuat', 'fvec4', 'float4', rot)
+        if scale is not None:
+            scale = str(scale)
+            set_bg3_attribute(transform_lsf, 'Scale', scale, attribute_type = 'float')
+            if transform_lsx is not None:
+                set_bg3_attribute(transform_lsx, 'Scale', scale, attribute_type = 'float', lsx = True)
 
     def set_light_radius(
             self,
@@ -418,16 +670,11 @@ class scene_object:
             /,
             lighting_setup_id: str = '00000000-0000-0000-0000-000000000000'
     ) -> None:
-        lsf_lights = self.__get_lights_lsf(lighting_setup_id)
-        if light_id not in lsf_lights:
-            raise RuntimeError(f'Light {light_id} is not found in lighting setup f{lighting_setup_id} in f{self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(lsf_lights[light_id], 'Radius', str(radius), attribute_type = 'float')
-
-        if self.__lsx_file is not None:
-            lsx_lights = self.__get_lights_lsx(lighting_setup_id)
-            if light_id not in lsx_lights:
-                raise RuntimeError(f'Light {light_id} is not found in lighting setup f{lighting_setup_id} in f{self.__lsx_file.relative_file_path}')
-            set_bg3_attribute(lsx_lights[light_id], 'Radius', str(radius), attribute_type = 'float')
+        for lsx, f in self.__documents:
+            lights = self.__get_lights(lighting_setup_id, lsx)
+            if light_id not in lights:
+                raise RuntimeError(f'Light {light_id} is not found in lighting setup {lighting_setup_id} in {f.relative_file_path}')
+            set_bg3_attribute(lights[light_id], 'Radius', str(radius), attribute_type = 'float')
 
 
     def set_light_position(
@@ -437,16 +684,14 @@ class scene_object:
             /,
             lighting_setup_id: str = '00000000-0000-0000-0000-000000000000'
     ) -> None:
-        lsf_lights = self.__get_lights_lsf(lighting_setup_id)
-        if light_id not in lsf_lights:
-            raise RuntimeError(f'Light {light_id} is not found in lighting setup f{lighting_setup_id} in f{self.__lsf_file.relative_file_path}')
-        set_bg3_attribute(lsf_lights[light_id], 'Position', f'{pos[0]} {pos[1]} {pos[2]}', attribute_type = 'fvec3')
-
-        if self.__lsx_file is not None:
-            lsx_lights = self.__get_lights_lsx(lighting_setup_id)
-            if light_id not in lsx_lights:
-                raise RuntimeError(f'Light {light_id} is not found in lighting setup f{lighting_setup_id} in f{self.__lsx_file.relative_file_path}')
-            pos_attr = lsx_lights[light_id].find('./attribute[@id="Position"]/float3')
+        for lsx, f in self.__documents:
+            lights = self.__get_lights(lighting_setup_id, lsx)
+            if light_id not in lights:
+                raise RuntimeError(f'Light {light_id} is not found in lighting setup {lighting_setup_id} in {f.relative_file_path}')
+            if not lsx:
+                set_bg3_attribute(lights[light_id], 'Position', vector_to_str(pos), attribute_type = 'fvec3')
+                continue
+            pos_attr = lights[light_id].find(LSX_POSITION_PATH)
             if pos_attr is None:
                 raise RuntimeError(f'Light {light_id} does not have a position')
             pos_attr.set('x', str(pos[0]))
@@ -454,27 +699,18 @@ class scene_object:
             pos_attr.set('z', str(pos[2]))
 
 
-    def __get_lights_lsf(self, lighting_setup_id: str) -> dict[str, et.Element]:
-        root_node = self.__lsf_file.xml.getroot()
-        setups = root_node.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="LightingSetups"]/children/node[@id="LightingSetup"]')
-        for setup in setups:
-            setup_id = get_required_bg3_attribute(setup, 'Id')
-            if setup_id == lighting_setup_id:
-                lights = setup.findall('./children/node[@id="Lights"]/children/node[@id="Light"]')
-                return { get_required_bg3_attribute(light, 'Id') : light for light in lights }
-        raise RuntimeError(f'Lighting setup {lighting_setup_id} not found in {self.__lsf_file}')
-
-    def __get_lights_lsx(self, lighting_setup_id: str) -> dict[str, et.Element]:
-        if self.__lsx_file is None:
-            raise RuntimeError('LSF is None')
-        root_node = self.__lsx_file.xml.getroot()
-        setups = root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="LightingSetups"]/children/node[@id="LightingSetup"]')
-        for setup in setups:
-            setup_id = get_required_bg3_attribute(setup, 'Id')
-            if setup_id == lighting_setup_id:
-                lights = setup.findall('./children/node[@id="Lights"]/children/node[@id="Light"]')
-                return { get_required_bg3_attribute(light, 'Id') : light for light in lights }
-        raise RuntimeError(f'Lighting setup {lighting_setup_id} not found in {self.__lsf_file}')
+    def __get_lights(self, lighting_setup_id: str, lsx: bool = False) -> dict[str, et.Element]:
+        # lighting setups never change here, build the light maps once per setup
+        key = (lsx, lighting_setup_id)
+        lights = self.__lights.get(key)
+        if lights is not None:
+            return lights
+        setup = self.__get_index('lighting setups', lsx).get(lighting_setup_id)
+        if setup is None:
+            raise RuntimeError(f'Lighting setup {lighting_setup_id} not found in {self.__document_file(lsx).relative_file_path}')
+        lights = { get_required_bg3_attribute(light, 'Id') : light for light in setup.iterfind(SETUP_LIGHTS_PATH) }
+        self.__lights[key] = lights
+        return lights
 
     def set_direction_light_dims(
             self,
@@ -482,61 +718,55 @@ class scene_object:
             stage_uuid: str,
             dimensions: tuple[float, float, float]
     ) -> None:
-        light = self.__get_light_element_lsf(light_uuid)
-        desc = light.find('./children/node[@id="Desc"]')
-        if desc is None:
-            raise RuntimeError(f'Light without a Desc node: {light_uuid} in {self.__lsf_file.relative_file_path}')
-        dld = get_or_create_child_node(desc, 'DirectionLightDimensions')
-        obj = et.fromstring(''.join([
-            '<node id="Object">',
-            f'<attribute id="MapKey" type="guid" value="{stage_uuid}" />',
-            f'<attribute id="MapValue" type="fvec3" value="{dimensions[0]} {dimensions[1]} {dimensions[2]}" />',
-            '</node>']))
-        put_object_into_map(dld, obj)
+        for lsx, f in self.__documents:
+            dld = self.__get_light_dimensions(light_uuid, lsx, f)
+            obj = et.Element('node', id = 'Object')
+            scene_object.__add_attribute(obj, 'MapKey', 'guid', stage_uuid)
+            if lsx:
+                scene_object.__add_lsx_vector_attribute(obj, 'MapValue', 'fvec3', 'float3', dimensions)
+            else:
+                scene_object.__add_attribute(obj, 'MapValue', 'fvec3', vector_to_str(dimensions))
+            put_object_into_map(dld, obj)
 
-        if self.__lsx_file is not None:
-            light = self.__get_light_element_lsx(light_uuid)
-            desc = light.find('./children/node[@id="Desc"]')
+    def __get_light_dimensions(self, light_uuid: str, lsx: bool, f: game_file) -> et.Element:
+        # Lights -> Desc -> DirectionLightDimensions is resolved once per light and document
+        key = (lsx, light_uuid)
+        dld = self.__light_dimensions.get(key)
+        if dld is None:
+            light = self.__get_index('lights', lsx).get(light_uuid)
+            if light is None:
+                raise RuntimeError(f'No light {light_uuid} defined in scene {f.relative_file_path}')
+            desc = light.find(LIGHT_DESC_PATH)
             if desc is None:
-                raise RuntimeError(f'Light without a Desc node: {light_uuid} in {self.__lsx_file.relative_file_path}')
+                if light.find(LIGHT_NODE_PATH) is None:
+                    raise RuntimeError(f'Corrupted scene file: {f.relative_file_path}')
+                raise RuntimeError(f'Light without a Desc node: {light_uuid} in {f.relative_file_path}')
             dld = get_or_create_child_node(desc, 'DirectionLightDimensions')
-            obj = et.fromstring(''.join([
-                '<node id="Object">',
-                f'<attribute id="MapKey" type="guid" value="{stage_uuid}" />',
-                f'<attribute id="MapValue" type="fvec3">',
-                f'<float3 x="{dimensions[0]}" y="{dimensions[1]}" z="{dimensions[2]}" />',
-                '</attribute></node>']))
-            put_object_into_map(dld, obj)
+            self.__light_dimensions[key] = dld
+        return dld
 
 
-    def __get_light_element_lsf(self, light_uuid: str) -> et.Element:
-        root_node = self.__lsf_file.xml.getroot()
-        lights = root_node.find('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="Lights"]')
-        if lights is None:
-            raise RuntimeError(f'No lights defined in scene {self.__lsf_file.relative_file_path}')
-        light = find_object_by_map_key(lights, light_uuid)
-        if light is None:
-            raise RuntimeError(f'No light {light_uuid} defined in scene {self.__lsf_file.relative_file_path}')
-        result = light.find('./children/node[@id="Lights"]')
-        if result is None:
-            raise RuntimeError(f'Corrupted scene file: {self.__lsf_file.relative_file_path}')
-        return result
-
-    def __get_light_element_lsx(self, light_uuid: str) -> et.Element:
-        if self.__lsx_file is None:
-            raise RuntimeError('LSF is None')
-        root_node = self.__lsx_file.xml.getroot()
-        lights = root_node.find('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="Lights"]')
-        if lights is None:
-            raise RuntimeError(f'No lights defined in scene {self.__lsf_file.relative_file_path}')
-        light = find_object_by_map_key(lights, light_uuid)
-        if light is None:
-            raise RuntimeError(f'No light {light_uuid} defined in scene {self.__lsf_file.relative_file_path}')
-        result = light.find('./children/node[@id="Lights"]')
-        if result is None:
-            raise RuntimeError(f'Corrupted scene file: {self.__lsf_file.relative_file_path}')
-        return result
-
+    @staticmethod
+    def __new_actor_node(
+            templaye_uuid: str,
+            actor_type: int,
+            look_at_mode: int,
+            important_for_staging: bool,
+            is_terrain_snapping_in_game_disabled: bool
+    ) -> et.Element:
+        actor_node = et.Element('node', id = 'TLActor')
+        scene_object.__add_attribute(actor_node, 'ActorType', 'uint8', f'{actor_type}')
+        scene_object.__add_attribute(actor_node, 'LookAtMode', 'uint8', f'{look_at_mode}')
+        scene_object.__add_attribute(actor_node, 'TemplateId', 'guid', templaye_uuid)
+        if important_for_staging:
+            scene_object.__add_attribute(actor_node, 'ImportantForStaging', 'bool', 'True')
+        if is_terrain_snapping_in_game_disabled:
+            scene_object.__add_attribute(actor_node, 'IsTerrainSnappingInGameDisabled', 'bool', 'True')
+        transforms = et.SubElement(et.SubElement(actor_node, 'children'), 'node', id = 'Transforms')
+        transform = et.SubElement(et.SubElement(transforms, 'children'), 'node', id = 'Object')
+        scene_object.__add_attribute(transform, 'MapKey', 'guid', DEFAULT_STAGE_UUID)
+        et.SubElement(transform, 'children')
+        return actor_node
 
     def create_new_actor(
             self,
@@ -550,30 +780,18 @@ class scene_object:
             important_for_staging: bool = True,
             is_terrain_snapping_in_game_disabled = True
     ) -> None:
-        actor_node = et.fromstring("".join([
-            '<node id="TLActor">',
-            f'<attribute id="ActorType" type="uint8" value="{actor_type}" />',
-            f'<attribute id="LookAtMode" type="uint8" value="{look_at_mode}" />',
-            f'<attribute id="TemplateId" type="guid" value="{templaye_uuid}" />',
-            '<attribute id="ImportantForStaging" type="bool" value="True" />' if important_for_staging else '',
-            '<attribute id="IsTerrainSnappingInGameDisabled" type="bool" value="True" />' if is_terrain_snapping_in_game_disabled else '',
-            '<children><node id="Transforms"><children>',
-            f'<node id="Object"><attribute id="MapKey" type="guid" value="{DEFAULT_STAGE_UUID}"/><children></children></node>',
-            '</children></node></children></node>'
-        ]))
-
-        root_node = self.__lsf_file.xml.getroot()
-        actors = root_node.find('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children')
-        if actors is None:
-            raise RuntimeError(f'Could not add a new actor to {self.__lsf_file.relative_file_path}')
-        actors.append(actor_node)
-
-        if self.__lsx_file is None:
-            root_node = self.__lsx_file.xml.getroot()
-            actors = root_node.find('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children')
+        # each document gets its own actor element, a shared one would end up with the transform format of the last writer
+        for lsx, f in self.__documents:
+            actors = self.__find_anchor(ACTORS_CHILDREN_PATH, lsx)
             if actors is None:
-                raise RuntimeError(f'Could not add a new actor to {self.__lsx_file.relative_file_path}')
-            actors.append(actor_node)
+                raise RuntimeError(f'Could not add a new actor to {f.relative_file_path}')
+            actors.append(scene_object.__new_actor_node(
+                templaye_uuid, actor_type, look_at_mode, important_for_staging, is_terrain_snapping_in_game_disabled))
+
+        self.__lsf_actors = None
+        self.__lsx_actors = None
+        self.__indexes.pop(('actors', False), None)
+        self.__indexes.pop(('actors', True), None)
 
         self.set_actor_transform(templaye_uuid, position, rotation, scale, stage_uuid = DEFAULT_STAGE_UUID)
 
@@ -591,48 +809,19 @@ class scene_object:
             stage_uuid = new_random_uuid()
         self.__current_stage_uuid = stage_uuid
 
-        new_stage = et.fromstring(''.join([
-            '<node id="TLStage">',
-            f'<attribute id="Identifier" type="guid" value="{self.__current_stage_uuid}" />',
-            '</node>'
-        ]))
-        if name is not None:
-            set_bg3_attribute(new_stage, 'Name', name, attribute_type = 'LSString')
-        if variation_base_stage_id is not None:
-            set_bg3_attribute(new_stage, 'VariationBaseStageId', variation_base_stage_id, attribute_type = 'guid')
-        if variation_conditions_id is not None:
-            set_bg3_attribute(new_stage, 'VariationConditionsId', variation_conditions_id, attribute_type = 'guid')
-        if variation_target_id is not None:
-            set_bg3_attribute(new_stage, 'VariationTargetId', variation_target_id, attribute_type = 'guid')
-
-        root_node = self.__lsf_file.xml.getroot()
-        scene_children = root_node.find('./region[@id="TLScene"]/node[@id="TLScene"]/children')
-        if not isinstance(scene_children, et.Element):
-            raise ValueError(f"{self.__lsf_file.relative_file_path} is not a valid scene")
-        stages = scene_children.find('./node[@id="TLStages"]')
-        if not isinstance(stages, et.Element):
-            stages = et.fromstring('<node id="TLStages"><children></children></node>')
-            scene_children.append(stages)
-        stages_children = stages.find('./children')
-        if not isinstance(stages_children, et.Element):
-            stages_children = et.fromstring('<children></children>')
-            stages.append(stages_children)
-        stages_children.append(new_stage)
-
-        if self.__lsx_file is not None:
-            root_node = self.__lsx_file.xml.getroot()
-            scene_children = root_node.find('./region[@id="TLScene"]/node[@id="root"]/children')
-            if not isinstance(scene_children, et.Element):
-                raise ValueError(f"{self.__lsx_file.relative_file_path} is not a valid scene")
-            stages = scene_children.find('./node[@id="TLStages"]')
-            if not isinstance(stages, et.Element):
-                stages = et.fromstring('<node id="TLStages"><children></children></node>')
-                scene_children.append(stages)
-            stages_children = stages.find('./children')
-            if not isinstance(stages_children, et.Element):
-                stages_children = et.fromstring('<children></children>')
-                stages.append(stages_children)
-            stages_children.append(new_stage)
+        for lsx, _ in self.__documents:
+            # the stage is new, its attributes are appended without looking for existing ones
+            new_stage = et.Element('node', id = 'TLStage')
+            scene_object.__add_attribute(new_stage, 'Identifier', 'guid', stage_uuid)
+            if name is not None:
+                scene_object.__add_attribute(new_stage, 'Name', 'LSString', name)
+            if variation_base_stage_id is not None:
+                scene_object.__add_attribute(new_stage, 'VariationBaseStageId', 'guid', variation_base_stage_id)
+            if variation_conditions_id is not None:
+                scene_object.__add_attribute(new_stage, 'VariationConditionsId', 'guid', variation_conditions_id)
+            if variation_target_id is not None:
+                scene_object.__add_attribute(new_stage, 'VariationTargetId', 'guid', variation_target_id)
+            self.__ensure_container('TLStages', lsx).append(new_stage)
 
         return stage_uuid
 
@@ -641,15 +830,13 @@ class scene_object:
         if stage_uuid is None:
             stage_uuid = self.__current_stage_uuid            
         camera_node = self.get_camera(camera_uuid)
-        nodes = camera_node.findall('./children/node')
-        for node in nodes:
-            if node.get('id') == 'AllowVariationToOverride':
-                continue
+        for node in camera_node.iterfind(CHILD_NODES_PATH):
             node_id = node.get('id')
-            stage_settings = node.findall('./children/node[@id="Object"]')
-            for stage_setting in stage_settings:
-                if get_required_bg3_attribute(stage_setting, 'MapKey') == stage_uuid:
-                    val = stage_setting.find('./attribute[@id="MapValue"]')
+            if node_id == 'AllowVariationToOverride':
+                continue
+            for stage_setting in node.iterfind(MAP_OBJECTS_PATH):
+                if get_bg3_attribute_value(stage_setting, 'MapKey') == stage_uuid:
+                    val = stage_setting.find(MAP_VALUE_ATTRIBUTE_PATH)
                     if val is not None:
                         val_type = val.get('type')
                         val_val = val.get('value')
@@ -659,15 +846,12 @@ class scene_object:
 
     def get_actor_transform(self, actor_id: str | int) -> dict[str, dict[str: tuple[str, ...] | str]]:
         actor = self.__find_actor(actor_id)
-        transforms = actor.findall('./children/node[@id="Transforms"]/children/node[@id="Object"]')
         result = dict[str, dict[str: tuple[str, ...] | str]]()
-        for transform in transforms:
+        for transform in actor.iterfind(ACTOR_TRANSFORMS_PATH):
             stage_uuid = get_required_bg3_attribute(transform, 'MapKey')
-            val = transform.find('./children/node[@id="MapValue"]')
+            val = transform.find(MAP_VALUE_PATH)
             if val is not None:
-                pos = tuple(get_required_bg3_attribute(val, 'Position').split(' '))
-                rot = tuple(get_required_bg3_attribute(val, 'RotationQuat').split(' '))
-                s = get_required_bg3_attribute(val, 'Scale')
+                pos, rot, s = scene_object.__read_transform(val)
                 d = dict[str: tuple[str, ...] | str]()
                 d['position'] = pos
                 d['rotation'] = rot
@@ -683,36 +867,21 @@ class scene_object:
             scale: float,
             stage_uuid: str | None = None
     ) -> None:
-        actor = self.__find_actor(actor_id)
-        self.__put_transform_into_stage_element_lsf(actor, position, rotation, scale, stage_uuid)
-
-        actor = self.__find_actor(actor_id, False)
-        self.__put_transform_into_stage_element_lsx(actor, position, rotation, scale, stage_uuid)
+        for lsx, _ in self.__documents:
+            actor = self.__find_actor(actor_id, not lsx)
+            self.__put_transform_into_stage_element(actor, position, rotation, scale, stage_uuid, lsx)
 
     def __find_actor(self, actor_id: str | int, use_lsf: bool = True) -> et.Element[str]:
-        if use_lsf:
-            root_node = self.__lsf_file.xml.getroot()
-            actors = root_node.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            filename = self.__lsf_file.relative_file_path
-        else:
-            if self.__lsx_file is None:
-                raise RuntimeError('LSX is None')
-            root_node = self.__lsx_file.xml.getroot()
-            actors = root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLActors"]/children/node[@id="TLActor"]')
-            filename = self.__lsx_file.relative_file_path
-        actor = None
+        if not use_lsf and self.__lsx_file is None:
+            raise RuntimeError('LSX is None')
+        actors = self.__get_actors(not use_lsf)
         if isinstance(actor_id, int):
             if actor_id >= len(actors):
-                raise ValueError(f'cannot find actor index {actor_id} in {filename}, there are only {len(actors)} actors')
-            actor = actors[actor_id]
-        else:
-            for a in actors:
-                tpl_uuid = get_bg3_attribute(actor, 'TemplateId')
-                if isinstance(tpl_uuid, str) and tpl_uuid == actor_id:
-                    actor = a
-                    break
+                raise ValueError(f'cannot find actor index {actor_id} in {self.__document_file(not use_lsf).relative_file_path}, there are only {len(actors)} actors')
+            return actors[actor_id]
+        actor = self.__get_index('actors', not use_lsf).get(actor_id)
         if actor is None:
-            raise ValueError(f'cannot find actor {actor_id} in {filename}')
+            raise ValueError(f'cannot find actor {actor_id} in {self.__document_file(not use_lsf).relative_file_path}')
         return actor
 
     def set_camera_transform(
@@ -723,30 +892,11 @@ class scene_object:
             scale: float | str,
             stage_uuid: str | None = None
     ) -> None:
-        found = False
-        root_node = self.__lsf_file.xml.getroot()
-        cameras = root_node.findall('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLCameras"]/children/node[@id="Object"]/children/node[@id="TLCameras"]')
-        for camera in cameras:
-            identifier = get_required_bg3_attribute(camera, 'Identifier')
-            if identifier == camera_uuid:
-                self.__put_transform_into_stage_element_lsf(camera, position, rotation, scale, stage_uuid)
-                found = True
-                break
-        if not found:
-            raise ValueError(f'cannot find camera {camera_uuid} in {self.__lsf_file.relative_file_path}')
-
-        if self.__lsx_file is not None:
-            found = False
-            root_node = self.__lsx_file.xml.getroot()
-            cameras = root_node.findall('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLCameras"]/children/node[@id="Object"]/children/node[@id="TLCameras"]')
-            for camera in cameras:
-                identifier = get_required_bg3_attribute(camera, 'Identifier')
-                if identifier == camera_uuid:
-                    self.__put_transform_into_stage_element_lsx(camera, position, rotation, scale, stage_uuid)
-                    found = True
-                    break
-            if not found:
-                raise ValueError(f'cannot find camera {camera_uuid} in {self.__lsf_file.relative_file_path}')
+        for lsx, f in self.__documents:
+            camera = self.__get_index('camera nodes', lsx).get(camera_uuid)
+            if camera is None:
+                raise ValueError(f'cannot find camera {camera_uuid} in {f.relative_file_path}')
+            self.__put_transform_into_stage_element(camera, position, rotation, scale, stage_uuid, lsx)
 
     def add_lights_to_camera(self, camera_uuid: str, lights_uuids: Iterable[str], /, stage_uuid: str | None = None) -> None:
         if stage_uuid is None:
@@ -756,101 +906,59 @@ class scene_object:
 
         lights_uuids = set(lights_uuids)
 
-        new_lights = list[et.Element]()
-        for light_uuid in lights_uuids:
-            new_lights.append(et.fromstring(f'<node id="MapValue"><attribute id="Object" type="guid" value="{light_uuid}"/></node>'))
-        root_node = self.__lsf_file.xml.getroot()
-        cameras = root_node.find('./region[@id="TLScene"]/node[@id="TLScene"]/children/node[@id="TLCameras"]')
-        if not isinstance(cameras, et.Element):
-            raise RuntimeError(f'bad stage file {self.__lsf_file.relative_file_path}')
-        camera = find_object_by_map_key(cameras, camera_uuid)
-        if camera is None:
-            raise KeyError(f'camera {camera_uuid} is not found in {self.__lsf_file.relative_file_path}')
-        lights = camera.findall('./children/node[@id="TLCameras"]/children/node[@id="LinkedLights"]')
-        self.__add_lights(lights, new_lights, lights_uuids, stage_uuid)
-
-        if self.__lsx_file is not None:
-            new_lights = list[et.Element]()
-            for light_uuid in lights_uuids:
-                new_lights.append(et.fromstring(f'<node id="MapValue"><attribute id="Object" type="guid" value="{light_uuid}"/></node>'))
-            root_node = self.__lsx_file.xml.getroot()
-            cameras = root_node.find('./region[@id="TLScene"]/node[@id="root"]/children/node[@id="TLCameras"]')
-            if not isinstance(cameras, et.Element):
-                raise RuntimeError(f'bad stage file {self.__lsx_file.relative_file_path}')
-            camera = find_object_by_map_key(cameras, camera_uuid)
+        for lsx, f in self.__documents:
+            camera = self.__get_index('cameras', lsx).get(camera_uuid)
             if camera is None:
-                raise KeyError(f'camera {camera_uuid} is not found in {self.__lsx_file.relative_file_path}')
-            lights = camera.findall('./children/node[@id="TLCameras"]/children/node[@id="LinkedLights"]')
-            self.__add_lights(lights, new_lights, lights_uuids, stage_uuid)
+                raise KeyError(f'camera {camera_uuid} is not found in {f.relative_file_path}')
+            lights = camera.findall(LINKED_LIGHTS_PATH)
+            self.__add_lights(lights, lights_uuids, stage_uuid)
+
+    @staticmethod
+    def __add_light_nodes(children: et.Element, lights_uuids: Iterable[str]) -> None:
+        for light_uuid in lights_uuids:
+            scene_object.__add_attribute(et.SubElement(children, 'node', id = 'MapValue'), 'Object', 'guid', light_uuid)
 
-    def __add_lights(self, lights: Iterable[et.Element], new_lights: Iterable[et.Element], lights_uuids: set[str], stage_uuid: str) -> None:
+    def __add_lights(self, lights: Iterable[et.Element], lights_uuids: set[str], stage_uuid: str) -> None:
         for light in lights:
             stage_lights = find_object_by_map_key(light, stage_uuid)
-            if stage_lights is not None:
-                children = stage_lights.find('./children')
-                if children is None:
-                    children = et.fromstring('<children></children>')
-                    for light in new_lights:
-                        children.append(light)
-                    stage_lights.append(children)
-                else:
-                    existing_lights = children.findall('./node[@id="Object"]')
-                    for existing_light in existing_lights:
-                        light_uuid = get_required_bg3_attribute(existing_light, 'Object')
-                        if light_uuid in lights_uuids:
-                            raise ValueError(f"duplicate light: {light_uuid}")
-                    for light in new_lights:
-                        children.append(light)
-
-    def __put_transform_into_stage_element_lsf(
+            if stage_lights is None:
+                continue
+            children = stage_lights.find(CHILDREN_PATH)
+            if children is None:
+                children = et.SubElement(stage_lights, 'children')
+            else:
+                existing_lights = { get_bg3_attribute_value(existing_light, 'Object') for existing_light in children.iterfind(MAP_VALUES_PATH) }
+                duplicate_lights = lights_uuids & existing_lights
+                if duplicate_lights:
+                    raise ValueError(f"duplicate light: {', '.join(sorted(duplicate_lights))}")
+            scene_object.__add_light_nodes(children, lights_uuids)
+
+    def __put_transform_into_stage_element(
             self,
             target: et.Element,
             position: tuple[float | str, float | str, float | str],
             rotation: tuple[float | str, float | str, float | str, float | str],
             scale: float | str,
-            stage_uuid: str | None = None
+            stage_uuid: str | None,
+            lsx: bool
     ) -> None:
         if stage_uuid is None:
             stage_uuid = self.__current_stage_uuid
-        new_transform = et.fromstring(''.join([
-                '<node id="Object">',
-                f'<attribute id="MapKey" type="guid" value="{stage_uuid}" />',
-                '<children><node id="MapValue">',
-                f'<attribute id="Position" type="fvec3" value="{position[0]} {position[1]} {position[2]}" />',
-                f'<attribute id="RotationQuat" type="fvec4" value="{rotation[0]} {rotation[1]} {rotation[2]} {rotation[3]}" />',
-                f'<attribute id="Scale" type="float" value="{scale}" />',
-                '</node></children></node>'
-        ]))
-        transforms_map = target.find('./children/node[@id="Transforms"]')
-        if not isinstance(transforms_map, et.Element):
-            transforms_map = target.find('./children/node[@id="Transform"]')
-            if not isinstance(transforms_map, et.Element):
-                raise ValueError(f'cannot add a new transform to stage {stage_uuid} {to_compact_string(target)}')
-        put_object_into_map(transforms_map, new_transform)
-
-    def __put_transform_into_stage_element_lsx(
-            self,
-            target: et.Element,
-            position: tuple[float, float, float],
-            rotation: tuple[float, float, float, float],
-            scale: float,
-            /,
-            stage_uuid: str | None
-    ) -> None:
-        if stage_uuid is None:
-            stage_uuid = self.__current_stage_uuid
-        new_transform = et.fromstring(''.join([
-                '<node id="Object">',
-                f'<attribute id="MapKey" type="guid" value="{stage_uuid}" />',
-                '<children><node id="MapValue">',
-                f'<attribute id="Position" type="fvec3"><float3 x="{position[0]}" y="{position[1]}" z="{position[2]}"/></attribute>',
-                f'<attribute id="RotationQuat" type="fvec4"><float4 x="{rotation[0]}" y="{rotation[1]}" z="{rotation[2]}" w="{rotation[3]}"/></attribute>',
-                f'<attribute id="Scale" type="float" value="{scale}" />',
-                '</node></children></node>'
-        ]))
-        transforms_map = target.find('./children/node[@id="Transforms"]')
+        new_transform = et.Element('node', id = 'Object')
+        scene_object.__add_attribute(new_transform, 'MapKey', 'guid', stage_uuid)
+        map_value = et.SubElement(et.SubElement(new_transform, 'children'), 'node', id = 'MapValue')
+        if lsx:
+            scene_object.__add_lsx_vector_attribute(map_value, 'Position', 'fvec3', 'float3', position)
+            scene_object.__add_lsx_vector_attribute(map_value, 'RotationQuat', 'fvec4', 'float4', rotation)
+        else:
+            scene_object.__add_attribute(map_value, 'Position', 'fvec3', vector_to_str(position))
+            scene_object.__add_attribute(map_value, 'RotationQuat', 'fvec4', vector_to_str(rotation))
+        scene_object.__add_attribute(map_value, 'Scale', 'float', f'{scale}')
+        transforms_map = target.find(TRANSFORMS_MAP_PATH)
         if not isinstance(transforms_map, et.Element):
-            transforms_map = target.find('./children/node[@id="Transform"]')
+            transforms_map = target.find(TRANSFORM_MAP_PATH)
             if not isinstance(transforms_map, et.Element):
                 raise ValueError(f'cannot add a new transform to stage {stage_uuid} {to_compact_string(target)}')
         put_object_into_map(transforms_map, new_transform)
+        self.__stage_transforms.pop(target, None)
+        self.__actor_transforms.pop(target, None)